@@ -1,8 +1,10 @@
 import csv
+import html
 import os
-import random
-import time
-from bs4 import BeautifulSoup
+import queue
+import re
+import threading
+from bs4 import BeautifulSoup, SoupStrainer
 from logger import setup_logging
 from twocaptcha import TwoCaptcha
 from playwright.sync_api import sync_playwright, Page
@@ -11,12 +13,93 @@ from playwright_stealth import Stealth
 
 class AttorneyDetailsScraper:
 
+    SUFFIXES_AND_PREFIXES = frozenset(
+        {
+            "JR",
+            "SR",
+            "II",
+            "III",
+            "IV",
+            "V",
+            "ESQ",
+            "ESQUIRE",
+            "VAN",
+            "DE",
+            "DEL",
+            "DI",
+            "LA",
+            "ST",
+            "VON",
+        }
+    )
+    NAME_SPLIT_RE = re.compile(r"\s+")
+
+    TARGET_FIELDS = {
+        "Estate Attorney": "Name:",
+        "Email": "Email:",
+        "Address": "Business Address:",
+        "Phone": "Business Phone:",
+    }
+    FIELD_PATTERNS = {
+        key: re.compile(
+            r"<span[^>]*>\s*"
+            + re.escape(label)
+            + r"\s*</span>\s*<span[^>]*class=\"[^\"]*\bCONT_Cell\b[^\"]*\"[^>]*>(.*?)</span>",
+            re.DOTALL,
+        )
+        for key, label in TARGET_FIELDS.items()
+    }
+    TAG_RE = re.compile(r"<[^>]+>")
+
+    # Mirrors extract_attorney_details() in the browser so only the four
+    # values cross the CDP connection instead of the full page HTML.
+    DETAILS_SCRIPT = """
+    (fields) => {
+        const labels = new Map();
+        document.querySelectorAll(".CONT_Default span").forEach((span) => {
+            const text = span.textContent.trim();
+            if (!labels.has(text)) labels.set(text, span);
+        });
+        const details = {};
+        for (const [key, labelText] of Object.entries(fields)) {
+            let cell = labels.has(labelText) ? labels.get(labelText).nextElementSibling : null;
+            while (cell && !(cell.tagName === "SPAN" && cell.classList.contains("CONT_Cell"))) {
+                cell = cell.nextElementSibling;
+            }
+            const parts = [];
+            if (cell) {
+                const walker = document.createTreeWalker(cell, NodeFilter.SHOW_TEXT);
+                while (walker.nextNode()) {
+                    const part = walker.currentNode.textContent.trim();
+                    if (part) parts.push(part);
+                }
+            }
+            details[key] = parts.join(" ");
+        }
+        return details;
+    }
+    """
+
     def __init__(self):
         self.base_url = "https://iapps.courts.state.ny.us"
         self.search_url = "https://iapps.courts.state.ny.us/attorneyservices"
         self.logger = setup_logging()
         self.cdp_url = os.getenv("CDP_URL")
         self.solver = TwoCaptcha(self.api_key)
+        self._attorneys_cache = None
+        self.page_recycle_interval = 50
+        self.selector_timeout = 15000
+        self._csv_fh = None
+        self._csv_writer = None
+        self._csv_lock = threading.RLock()
+        self._pending = []
+        self.csv_batch_size = 100
+        self.worker_count = 4
+        self._worker_errors = {}
+        self.captcha_timeout = 300000
+        self._captcha_lock = threading.Lock()
+        self._no_captcha = threading.Event()
+        self._no_captcha.set()
 
     def connect_and_setup(self, p: sync_playwright) -> Page:
         """
@@ -26,243 +109,436 @@ class AttorneyDetailsScraper:
         page session. It incorporates the Playwright Stealth plugin to obfuscate
         automation footprints and bypass fingerprinting, ensuring the session
         maintains a high browser trust score.
+
+        Stealth is applied to the new tab only, not to the shared context: every
+        worker has its own CDP connection, and context-level init scripts of each
+        connection would otherwise be injected into the tabs of all the others.
         """
 
         self.logger.info("Attempting to connect to running Chrome instance.")
         browser = p.chromium.connect_over_cdp(self.cdp_url)
         context = browser.contexts[0]
-        stealth = Stealth()
-        stealth.apply_stealth_sync(context)
-        page = context.new_page()
+        page = self.new_stealth_page(context)
         self.logger.info(
             f"Successfully connected and created new tab. Navigating to {self.search_url}"
         )
         return page
 
+    def new_stealth_page(self, context) -> Page:
+        """Opens a new tab in `context` with the stealth patches applied to it once."""
+        page = context.new_page()
+        Stealth().apply_stealth_sync(page)
+        return page
+
+    def get_search_locators(self, page: Page) -> dict:
+        """Builds the reusable locators of the attorney search form for the given page."""
+        return {
+            "first_name": page.locator(
+                'input[name="wmcSearchTabs:pnlAttorneySearch:nameSearchPanel:strFirstName"]'
+            ),
+            "middle_name": page.locator(
+                'input[name="wmcSearchTabs:pnlAttorneySearch:nameSearchPanel:strMiddleName"]'
+            ),
+            "last_name": page.locator(
+                'input[name="wmcSearchTabs:pnlAttorneySearch:nameSearchPanel:strLastName"]'
+            ),
+            "captcha": page.locator(".h-captcha"),
+            "submit": page.locator('.BTN_Green[name="btnSubmit"]'),
+            "no_results": page.locator(".CONT_MsgBox_Error"),
+            "result_links": page.locator(".STR_Visited"),
+        }
+
+    def recycle_page(self, page: Page) -> Page:
+        """
+        Replaces the working tab with a fresh one in the same browser context.
+
+        Long sessions on a single tab keep growing the renderer's memory, so the
+        tab is closed and reopened every `page_recycle_interval` attorneys. The
+        context itself belongs to the user's Chrome profile (attached via CDP) and
+        is kept open so the trusted session and cookies are preserved.
+        """
+        context = page.context
+        self.logger.info("Recycling the search tab to release browser memory.")
+        page.close()
+        page = self.new_stealth_page(context)
+        page.goto(self.search_url, timeout=60000, wait_until="domcontentloaded")
+        return page
+
     def get_attorneys_list(self):
         """
         Parses 'scraped_data.csv' to retrieve a deduplicated list of attorney names.
+        Names are deduplicated case-insensitively while reading, attorneys already
+        present in 'attorney_details.csv' are dropped, and the result is cached on
+        the instance so repeated calls do not re-parse the file.
         Returns:
             list: Unique attorney names extracted from the csv file.
         """
+        if self._attorneys_cache is not None:
+            return self._attorneys_cache
+
         file_path = "scraped_data.csv"
-        attorney_list = []
+        unique_attorneys = {}
 
         try:
             with open(file_path, mode="r", encoding="utf-8") as csvfile:
                 reader = csv.DictReader(csvfile)
 
-                attorney_list = set(
-                    row["Estate Attorney"].strip()
-                    for row in reader
-                    if row.get("Estate Attorney")
-                )
+                for row in reader:
+                    attorney = (row["Estate Attorney"] or "").strip()
+                    if attorney:
+                        unique_attorneys.setdefault(attorney.casefold(), attorney)
 
         except FileNotFoundError:
             print(f"Error: {file_path} does not exist.")
         except KeyError:
             print("Error: The column 'Estate Attorney' was not found in the CSV.")
 
-        return list(attorney_list)
+        processed_attorneys = self.get_processed_attorneys()
+        self._attorneys_cache = [
+            attorney
+            for attorney in unique_attorneys.values()
+            if self.name_key(attorney) not in processed_attorneys
+        ]
+        skipped = len(unique_attorneys) - len(self._attorneys_cache)
+        if skipped:
+            self.logger.info(
+                f"Skipping {skipped} attorneys already saved in attorney_details.csv"
+            )
+        return self._attorneys_cache
+
+    @staticmethod
+    def name_key(name):
+        """Order- and punctuation-insensitive key used to compare attorney names."""
+        return frozenset(name.upper().replace(",", " ").split())
+
+    def get_processed_attorneys(self):
+        """
+        Reads the names already written to 'attorney_details.csv' by earlier runs
+        so that those attorneys are not searched again.
+        Returns:
+            set: Name keys (see `name_key`) of the attorneys already scraped.
+        """
+        file_path = "attorney_details.csv"
+        if not os.path.exists(file_path):
+            return set()
+
+        with open(file_path, mode="r", encoding="utf-8") as csvfile:
+            return {
+                self.name_key(row["Estate Attorney"])
+                for row in csv.DictReader(csvfile)
+                if row.get("Estate Attorney")
+            }
 
     def run(self):
         """
         Main execution loop for processing attorney searches and data extraction.
 
-        This method normalizes attorney names by removing specific suffixes/prefixes
-        to ensure form compatibility. It implements human-mimicry via randomized
-        delays and manual Captcha intervention. The search logic utilizes a custom
-        matching algorithm that prioritizes exact string matches within result sets,
-        defaulting to the primary result when an exact match is unavailable.
-
-        Additionally, it identifies search queries that return no results,
-        logging these instances as warnings and skipping the records to maintain
-        data integrity within the final log and CSV output.
+        The deduplicated attorney names are placed on a shared queue and consumed
+        by `worker_count` threads. Each worker attaches its own Playwright driver to
+        the running Chrome instance and works in a separate tab of the same trusted
+        browser session, so several searches run concurrently while results are
+        written through a single lock-guarded CSV writer.
         """
 
         self.logger.info("Starting the New York Court script...")
+        try:
+            attorney_queue = queue.Queue()
+            for attorney in self.get_attorneys_list():
+                attorney_queue.put(attorney)
+
+            workers = [
+                threading.Thread(
+                    target=self.process_attorneys,
+                    args=(attorney_queue, worker_id),
+                    name=f"attorney-worker-{worker_id}",
+                )
+                for worker_id in range(1, self.worker_count + 1)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+            if self._worker_errors:
+                self.logger.error(
+                    f"{len(self._worker_errors)} of {self.worker_count} workers stopped unexpectedly. {attorney_queue.qsize()} attorneys were not searched."
+                )
+                for worker_id, error in sorted(self._worker_errors.items()):
+                    self.logger.error(f"Worker {worker_id} failed with: {error}")
+            else:
+                self.logger.info(
+                    "No more Attorneys left. Successfully Scraped all the attorneys contact details and save to CSV file."
+                )
+                self.logger.info(
+                    "Proccess Finished: Browser Closed. Complete data saved to CSV."
+                )
+        except Exception as e:
+            self.logger.error(f"\nFATAL ERROR during execution: {e}")
+        finally:
+            self._flush_csv()
+            self._close_csv()
+
+    def process_attorneys(self, attorney_queue: queue.Queue, worker_id: int):
+        """
+        Worker loop that pulls attorney names from the shared queue until it is empty.
+
+        Playwright's sync API is bound to the thread that started it, so every worker
+        runs its own `sync_playwright()` and CDP connection, opens its own tab, and
+        recycles that tab every `page_recycle_interval` attorneys. A worker that stops
+        on an error records it in `_worker_errors` for `run()` to report.
+        """
         try:
             with sync_playwright() as p:
                 page = self.connect_and_setup(p)
-                attorneys_list = self.get_attorneys_list()
                 page.goto(self.search_url, timeout=60000, wait_until="domcontentloaded")
+                locators = self.get_search_locators(page)
+                processed = 0
 
-                suffixes_and_prefixes = [
-                    "JR",
-                    "SR",
-                    "II",
-                    "III",
-                    "IV",
-                    "V",
-                    "ESQ",
-                    "ESQUIRE",
-                    "VAN",
-                    "DE",
-                    "DEL",
-                    "DI",
-                    "LA",
-                    "ST",
-                    "VON",
-                ]
-                for attorney in attorneys_list:
-
-                    scraped_attorney = []
+                while True:
                     try:
-                        self.logger.info(f"Searching Details for attorney: {attorney}")
-                        first_name = None
-                        middle_name = None
-                        last_name = None
-                        if "O Connor" in attorney:
-                            attorney = attorney.replace("O Connor", "O'Connor")
-                        attorney_name = attorney.split(" ")
-
-                        cleaned_name = [
-                            p
-                            for p in attorney_name
-                            if p.strip() and p.upper() not in suffixes_and_prefixes
-                        ]
-                        if len(cleaned_name) == 2:
-                            first_name = cleaned_name[0]
-                            last_name = cleaned_name[1]
-
-                        if len(cleaned_name) == 3 or len(cleaned_name) == 4:
-                            first_name = cleaned_name[0]
-                            middle_name = cleaned_name[1]
-                            last_name = cleaned_name[2]
-
-                        if first_name:
-                            locate_first_name = page.locator(
-                                'input[name="wmcSearchTabs:pnlAttorneySearch:nameSearchPanel:strFirstName"]'
-                            )
-                            locate_first_name.clear()
-                            locate_first_name.press_sequentially(
-                                first_name,
-                                delay=random.randint(80, 180),
-                            )
-                        locate_last_name = page.locator(
-                            'input[name="wmcSearchTabs:pnlAttorneySearch:nameSearchPanel:strLastName"]'
-                        )
-                        locate_last_name.clear()
-                        if last_name:
-
-                            locate_last_name.press_sequentially(
-                                last_name,
-                                delay=random.randint(80, 180),
-                            )
-                        locate_middle_name = page.locator(
-                            'input[name="wmcSearchTabs:pnlAttorneySearch:nameSearchPanel:strMiddleName"]'
-                        )
-                        locate_middle_name.clear()
-                        if middle_name:
-                            locate_middle_name.press_sequentially(
-                                middle_name,
-                                delay=random.randint(80, 180),
-                            )
-
-                        captcha = page.locator(".h-captcha")
-                        if captcha.is_visible():
-                            self.logger.info("!!! CAPTCHA DETECTED !!!")
-                            self.logger.info(
-                                "Please resolve the captcha and then click on search."
-                            )
-
-                        page.locator('.BTN_Green[name="btnSubmit"]').click()
-
-                        time.sleep(2)
-                        no_results = page.locator(".CONT_MsgBox_Error")
-                        if no_results.count() > 0 and no_results.is_visible():
-                            if (
-                                "Your Attorney search returned no results."
-                                in no_results.inner_text()
-                            ):
-                                self.logger.warning(
-                                    f"No results found for attorney: {attorney} . Skipping this attorney!"
-                                )
-                                continue
-
-                        page.wait_for_selector(".STR_Visited", timeout=90000)
-                        links = page.locator(".STR_Visited").all()
-                        target_link = None
-
-                        search_name_upper = attorney.upper()
-
-                        for link in links:
-                            link_text = link.inner_text().upper()
-                            attorney_name_parts = set(search_name_upper.split())
-                            link_text_parts = set(link_text.replace(",", " ").split())
-                            if attorney_name_parts == link_text_parts:
-                                target_link = link
-                                self.logger.info(f"Found exact match: {link_text}")
-                                break
-
-                        link_to_click = target_link if target_link else links[0]
-
-                        if not target_link:
-                            self.logger.warning(
-                                f"No exact match found for {attorney}. Clicking first result: {links[0].inner_text()}"
-                            )
-
-                        with page.context.expect_page() as new_page_info:
-                            link_to_click.click()
-
-                        new_page = new_page_info.value
-                        new_page.wait_for_load_state("networkidle")
-
-                        self.logger.info(
-                            f"Navigated to attorney details page URL: {new_page.url}"
-                        )
-
-                        response = new_page.content()
-                        attorney_details = self.extract_attorney_details(response)
-
-                        self.logger.info("Close the attorney details page.")
-                        new_page.close()
-                        self.logger.info("Successfully Extracted Attorney Details")
-                        scraped_attorney.append(attorney_details)
-                        page.go_back(timeout=60000)
-                        self.logger.info("Now Saving attorney details to CSV")
-                        self.save_to_csv(scraped_attorney)
-                        self.logger.info("Navigated back to the form page")
-                        time.sleep(1)
-
-                    except Exception as e:
-                        self.logger.error(f"Error processing attorney {attorney}: {e}")
-                        continue
+                        attorney = attorney_queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    if processed and processed % self.page_recycle_interval == 0:
+                        page = self.recycle_page(page)
+                        locators = self.get_search_locators(page)
+                    processed += 1
+
+                    self._no_captcha.wait()
+                    self.search_attorney(page, locators, attorney)
 
                 self.logger.info(
-                    "No more Attorneys left. Successfully Scraped all the attorneys contact details and save to CSV file."
+                    f"Worker {worker_id} finished after processing {processed} attorneys."
                 )
+        except Exception as e:
+            self.logger.error(f"Worker {worker_id} stopped unexpectedly: {e}")
+            self._worker_errors[worker_id] = str(e)
+
+    def wait_for_captcha(self, page: Page):
+        """
+        Hands an hCaptcha shown in this worker's tab over to the user.
+
+        Only one captcha is presented at a time: the tab is brought to the front and
+        the other workers hold off their next search until the captcha's response
+        token is filled in or `captcha_timeout` expires.
+        """
+        with self._captcha_lock:
+            self._no_captcha.clear()
+            try:
+                page.bring_to_front()
                 self.logger.info(
-                    "Proccess Finished: Browser Closed. Complete data saved to CSV."
+                    f"!!! CAPTCHA DETECTED in the tab of {threading.current_thread().name} !!!"
+                )
+                self.logger.info(
+                    "Please resolve the captcha in the tab brought to the front. The other workers are paused until it is solved."
+                )
+                page.wait_for_function(
+                    """() => {
+                        const response = document.querySelector('[name="h-captcha-response"]');
+                        return response !== null && response.value !== "";
+                    }""",
+                    timeout=self.captcha_timeout,
+                )
+                self.logger.info("Captcha solved. Resuming the search.")
+            finally:
+                self._no_captcha.set()
+
+    def search_attorney(self, page: Page, locators: dict, attorney: str):
+        """
+        Searches a single attorney on the portal and saves the matching profile.
+
+        This method normalizes the attorney name by removing specific suffixes/prefixes
+        to ensure form compatibility. Form fields are filled atomically and manual
+        Captcha intervention is supported. The search logic utilizes a custom
+        matching algorithm that prioritizes exact string matches within result sets,
+        defaulting to the primary result when an exact match is unavailable.
+        When a captcha is shown, the search waits for it to be solved through
+        `wait_for_captcha` before submitting.
+
+        Additionally, it identifies search queries that return no results,
+        logging these instances as warnings and skipping the records to maintain
+        data integrity within the final log and CSV output.
+        """
+        scraped_attorney = []
+        try:
+            self.logger.info(f"Searching Details for attorney: {attorney}")
+            first_name = None
+            middle_name = None
+            last_name = None
+            if "O Connor" in attorney:
+                attorney = attorney.replace("O Connor", "O'Connor")
+            cleaned_name = [
+                p
+                for p in self.NAME_SPLIT_RE.split(attorney)
+                if p and p.upper() not in self.SUFFIXES_AND_PREFIXES
+            ]
+            if len(cleaned_name) == 2:
+                first_name = cleaned_name[0]
+                last_name = cleaned_name[1]
+
+            if len(cleaned_name) == 3 or len(cleaned_name) == 4:
+                first_name = cleaned_name[0]
+                middle_name = cleaned_name[1]
+                last_name = cleaned_name[2]
+
+            if first_name:
+                locators["first_name"].fill(first_name)
+            locators["last_name"].fill(last_name or "")
+            locators["middle_name"].fill(middle_name or "")
+
+            if locators["captcha"].is_visible():
+                self.wait_for_captcha(page)
+
+            locators["submit"].click()
+            page.wait_for_selector(
+                ".CONT_MsgBox_Error, .STR_Visited",
+                state="visible",
+                timeout=90000,
+            )
+
+            if (
+                locators["no_results"].count() > 0
+                and locators["no_results"].is_visible()
+            ):
+                if (
+                    "Your Attorney search returned no results."
+                    in locators["no_results"].inner_text()
+                ):
+                    self.logger.warning(
+                        f"No results found for attorney: {attorney} . Skipping this attorney!"
+                    )
+                    return
+
+            page.wait_for_selector(".STR_Visited", timeout=self.selector_timeout)
+            links = locators["result_links"].all()
+            link_texts = locators["result_links"].all_inner_texts()
+
+            link_index = {}
+            for i, link_text in enumerate(link_texts):
+                link_index.setdefault(self.name_key(link_text), i)
+
+            match_index = link_index.get(self.name_key(attorney))
+
+            if match_index is not None:
+                link_to_click = links[match_index]
+                self.logger.info(
+                    f"Found exact match: {link_texts[match_index].upper()}"
+                )
+            else:
+                link_to_click = links[0]
+                self.logger.warning(
+                    f"No exact match found for {attorney}. Clicking first result: {link_texts[0]}"
                 )
+
+            link_to_click.evaluate("el => el.removeAttribute('target')")
+            with page.expect_navigation(wait_until="domcontentloaded"):
+                link_to_click.click()
+
+            page.wait_for_selector(".CONT_Default span", timeout=self.selector_timeout)
+
+            self.logger.info(f"Navigated to attorney details page URL: {page.url}")
+
+            attorney_details = self.read_attorney_details(page)
+
+            self.logger.info("Successfully Extracted Attorney Details")
+            scraped_attorney.append(attorney_details)
+            self.logger.info("Now Saving attorney details to CSV")
+            self.save_to_csv(scraped_attorney)
+
         except Exception as e:
-            self.logger.error(f"\nFATAL ERROR during execution: {e}")
+            self.logger.error(f"Error processing attorney {attorney}: {e}")
+        finally:
+            self.restore_search_form(page)
+
+    def restore_search_form(self, page: Page):
+        """
+        Reloads the search form in the worker's tab after every search, whatever its
+        outcome. Profiles open in the same tab, and a no-results error box left on
+        the page could be matched by the next search before its own response has
+        rendered, so the next attorney always starts from a fresh form.
+        """
+        try:
+            page.goto(self.search_url, timeout=60000, wait_until="domcontentloaded")
+            self.logger.info("Reloaded the search form page")
+        except Exception as e:
+            self.logger.error(f"Failed to reload the search form page: {e}")
+
+    def read_attorney_details(self, page: Page):
+        """
+        Extracts the attorney contact fields directly from the live profile page.
+
+        The label/value lookup runs inside the browser via `page.evaluate`, so only
+        the four extracted values are transferred. If none of the fields could be
+        read, it falls back to parsing the full page HTML with
+        `extract_attorney_details`.
+        """
+        details = page.evaluate(self.DETAILS_SCRIPT, self.TARGET_FIELDS)
+
+        if not any(details.values()):
+            self.logger.warning(
+                "Attorney details not found in the live page. Falling back to HTML parsing."
+            )
+            return self.extract_attorney_details(page.content())
+
+        self.logger.info(
+            f"Extracted the attorney: {details['Estate Attorney']} complete details"
+        )
+        return details
 
     def extract_attorney_details(self, response):
         """
         Parses the attorney profile HTML to extract structured contact information.
 
-        This method utilizes BeautifulSoup to map specific labels to their corresponding
-        data cells. It performs DOM traversal to locate key fields—including name,
-        email, address, and phone—and returns a sanitized dictionary of the
-        attorney's professional details.
+        The profile template is fixed, so the label/value pairs for name, email,
+        address, and phone are first matched with precompiled regular expressions.
+        If the template does not match, it falls back to BeautifulSoup DOM
+        traversal. Returns a sanitized dictionary of the attorney's professional
+        details.
+        """
+        details = self.match_attorney_fields(response)
+        if details is None:
+            details = self.parse_attorney_fields(response)
+
+        if details:
+            self.logger.info(
+                f"Extracted the attorney: {details['Estate Attorney']} complete details"
+            )
+        return details
+
+    def match_attorney_fields(self, response):
+        """
+        Extracts the contact fields from the fixed profile template with the
+        precompiled `FIELD_PATTERNS`, avoiding a parse tree altogether.
+        Returns None when any field is missing so the caller can fall back to
+        `parse_attorney_fields`.
         """
-        soup = BeautifulSoup(response, "html.parser")
         details = {}
+        for key, pattern in self.FIELD_PATTERNS.items():
+            match = pattern.search(response)
+            if not match:
+                return None
+            value = self.TAG_RE.sub(" ", match.group(1))
+            details[key] = " ".join(html.unescape(value).split())
+        return details
 
-        target_fields = {
-            "Estate Attorney": "Name:",
-            "Email": "Email:",
-            "Address": "Business Address:",
-            "Phone": "Business Phone:",
-        }
+    def parse_attorney_fields(self, response):
+        """
+        Builds a BeautifulSoup tree (lxml backend) of the `.CONT_Default` blocks and
+        maps each label span to its following `CONT_Cell` value span.
+        """
+        soup = BeautifulSoup(
+            response, "lxml", parse_only=SoupStrainer(class_="CONT_Default")
+        )
+        details = {}
 
         all_spans = soup.select(".CONT_Default span")
+        label_index = {}
+        for span in all_spans:
+            label_index.setdefault(span.get_text(strip=True), span)
 
-        for key, label_text in target_fields.items():
-            label_span = next(
-                (s for s in all_spans if s.get_text(strip=True) == label_text), None
-            )
+        for key, label_text in self.TARGET_FIELDS.items():
+            label_span = label_index.get(label_text)
 
             if label_span:
                 value_span = label_span.find_next_sibling("span", class_="CONT_Cell")
@@ -273,46 +549,72 @@ class AttorneyDetailsScraper:
             else:
                 details[key] = ""
 
-        if details:
-            self.logger.info(
-                f"Extracted the attorney: {details['Estate Attorney']} complete details"
-            )
         return details
 
-    def save_to_csv(self, scraped_data):
-        """Saves the scraped data to a CSV file."""
-        file_exists = os.path.exists("attorney_details.csv")
-
-        try:
-            with open(
+    def _get_writer(self):
+        """
+        Lazily opens 'attorney_details.csv' in append mode and returns a csv writer
+        bound to it. The handle stays open for the whole run; the header row is
+        written only when the file is empty.
+        """
+        if self._csv_writer is None:
+            self._csv_fh = open(
                 "attorney_details.csv", mode="a", newline="", encoding="utf-8"
-            ) as csvfile:
-                writer = csv.writer(csvfile)
-
-                if not file_exists:
-                    writer.writerow(
-                        [
-                            "Estate Attorney",
-                            "Email",
-                            "Address",
-                            "Phone",
-                        ]
-                    )
+            )
+            self._csv_writer = csv.writer(self._csv_fh)
+
+            if self._csv_fh.tell() == 0:
+                self._csv_writer.writerow(
+                    [
+                        "Estate Attorney",
+                        "Email",
+                        "Address",
+                        "Phone",
+                    ]
+                )
+        return self._csv_writer
+
+    def _close_csv(self):
+        """Closes the CSV file handle opened by `_get_writer`, if any."""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+
+    def _flush_csv(self):
+        """Writes all buffered rows to 'attorney_details.csv' in a single batch."""
+        with self._csv_lock:
+            if not self._pending:
+                return
+            try:
+                self._get_writer().writerows(self._pending)
+                self._csv_fh.flush()
+                self.logger.info(
+                    f"Data successfully saved to attorney_details.csv ({len(self._pending)} rows)"
+                )
+                self._pending.clear()
 
-                for item in scraped_data:
-                    writer.writerow(
-                        [
-                            item.get("Estate Attorney", ""),
-                            item.get("Email", ""),
-                            item.get("Address", ""),
-                            item.get("Phone", ""),
-                        ]
-                    )
+            except Exception as e:
+                self.logger.error(f"Error saving to CSV: {e}")
 
-            self.logger.info("Data successfully saved to attorney_details.csv")
+    def save_to_csv(self, scraped_data):
+        """
+        Buffers the scraped data and writes it to the CSV file once
+        `csv_batch_size` rows are pending. Safe to call from several workers.
+        """
+        with self._csv_lock:
+            for item in scraped_data:
+                self._pending.append(
+                    [
+                        item.get("Estate Attorney", ""),
+                        item.get("Email", ""),
+                        item.get("Address", ""),
+                        item.get("Phone", ""),
+                    ]
+                )
 
-        except Exception as e:
-            self.logger.error(f"Error saving to CSV: {e}")
+            if len(self._pending) >= self.csv_batch_size:
+                self._flush_csv()
 
 
 if __name__ == "__main__":
@@ -1,23 +1,85 @@
 import logging
+import logging.handlers
+import multiprocessing
 
 # --- Logging Setup ---
 
+LOG_BUFFER_CAPACITY = 1024
+
+_LOGGER = None
+_FILE_HANDLERS = None
+
+
+def _get_file_handlers():
+    """
+    Opens info.log and error.log once per process and reuses the handlers. Info
+    records are buffered in memory and written in batches of `LOG_BUFFER_CAPACITY`,
+    or as soon as an error is logged; errors are written to error.log immediately.
+    """
+    global _FILE_HANDLERS
+    if _FILE_HANDLERS is None:
+        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+        info_handler = logging.FileHandler("info.log", mode="a", encoding="utf-8")
+        info_handler.setLevel(logging.INFO)
+        info_handler.setFormatter(formatter)
+
+        error_handler = logging.FileHandler("error.log", mode="a", encoding="utf-8")
+        error_handler.setLevel(logging.ERROR)
+        error_handler.setFormatter(formatter)
+
+        buffered_info_handler = logging.handlers.MemoryHandler(
+            LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=info_handler
+        )
+        buffered_info_handler.setLevel(logging.INFO)
+
+        _FILE_HANDLERS = (buffered_info_handler, error_handler)
+
+    return _FILE_HANDLERS
+
 
 def setup_logging():
+    global _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
+
     logger = logging.getLogger("MarylandScraper")
     logger.setLevel(logging.INFO)
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 
-    info_handler = logging.FileHandler("info.log", mode="a", encoding="utf-8")
-    info_handler.setLevel(logging.INFO)
-    info_handler.setFormatter(formatter)
+    if not logger.handlers:
+        for handler in _get_file_handlers():
+            logger.addHandler(handler)
 
-    error_handler = logging.FileHandler("error.log", mode="a", encoding="utf-8")
-    error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(formatter)
+    _LOGGER = logger
+    return logger
 
-    if not logger.handlers:
-        logger.addHandler(info_handler)
-        logger.addHandler(error_handler)
 
+def start_log_listener(mp_context=None):
+    """
+    Starts a QueueListener in the parent process that writes the records sent by
+    worker processes to the parent's log files. The queue is created from
+    `mp_context` (the default context if None), which must match the context of the
+    worker processes. Returns the queue to hand to the workers and the listener,
+    which must be stopped once the workers are done.
+    """
+    log_queue = (mp_context or multiprocessing).Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *_get_file_handlers(), respect_handler_level=True
+    )
+    listener.start()
+    return log_queue, listener
+
+
+def setup_worker_logging(log_queue):
+    """
+    Process pool initializer. Replaces any handlers inherited from the parent with a
+    single QueueHandler, so workers never open the log files themselves.
+    """
+    global _LOGGER
+    logger = logging.getLogger("MarylandScraper")
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _LOGGER = logger
     return logger
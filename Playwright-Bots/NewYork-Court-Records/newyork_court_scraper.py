@@ -1,12 +1,150 @@
+import calendar
 import csv
+import multiprocessing
 import os
+import re
+import shelve
 import sys
-from datetime import datetime
+import threading
 import time
-from bs4 import BeautifulSoup
-from logger import setup_logging
-from dateutil.relativedelta import relativedelta
-from playwright.sync_api import sync_playwright, Page
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple, Optional
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from logger import setup_logging, setup_worker_logging, start_log_listener
+from playwright.sync_api import (
+    sync_playwright,
+    Page,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# Restrict the BeautifulSoup fallback to the fragments that are actually read.
+_DETAIL_STRAINER = SoupStrainer("form")
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+_BLOCKED_DOMAINS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar")
+
+# Selectors of the BeautifulSoup fallback, compiled once.
+_COURT_SEL = sv.compile("#Court")
+_FILE_NUMBER_SEL = sv.compile("#FileNumber")
+_BOLD_STYLE_RE = re.compile("font-weight:bold")
+
+# Reads the file history fields of a document; mirrors `extract_labeled_values`.
+_READ_DETAILS_JS = """
+    const readDetails = (doc, labels) => {
+        const text = (el) => {
+            const parts = [];
+            const walker = doc.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+            while (walker.nextNode()) {
+                const part = walker.currentNode.textContent.trim();
+                if (part) parts.push(part);
+            }
+            return parts.join(" ");
+        };
+        const rows = new Map();
+        doc.querySelectorAll("div.col-sm-8").forEach((row) => {
+            const labelText = text(row.querySelector("div.col-sm-3") || row);
+            const label = labels.find((l) => labelText.startsWith(l));
+            if (label && !rows.has(label)) rows.set(label, row);
+        });
+        const values = {};
+        for (const [label, row] of rows) {
+            const node =
+                row.querySelector(".BoldFont") ||
+                row.querySelector('[style*="font-weight:bold"]') ||
+                row.querySelector("div.col-sm-9");
+            values[label] = node ? text(node) : text(row).slice(label.length).trim();
+        }
+        return {
+            county: doc.getElementById("Court")?.value ?? null,
+            fileNo: doc.getElementById("FileNumber")?.value ?? null,
+            values,
+        };
+    };
+"""
+
+# Reads the file history fields of the live page.
+_DETAIL_SCRIPT = (
+    "(labels) => {" + _READ_DETAILS_JS + "    return readDetails(document, labels);\n}"
+)
+
+# Submits the form of every file link with fetch(), at most `concurrency` at a time,
+# and reads each file history response; a request still pending after `timeout` ms is
+# aborted. Returns null when the links are not submit buttons of a form, so the
+# caller can fall back to clicking them.
+_FETCH_DETAILS_SCRIPT = (
+    "async ({ selector, labels, concurrency, timeout }) => {" + _READ_DETAILS_JS + """
+    const buttons = [...document.querySelectorAll(selector)];
+    if (!buttons.every((button) => button.form && button.type === "submit")) {
+        return null;
+    }
+    const fetchDetails = async (button) => {
+        const form = button.form;
+        const method = (button.getAttribute("formmethod") || form.method).toUpperCase();
+        const url = new URL(
+            button.hasAttribute("formaction") ? button.formAction : form.action
+        );
+        const enctype = button.hasAttribute("formenctype")
+            ? button.formEnctype
+            : form.enctype;
+        const data = new FormData(form, button);
+        const init = {
+            method,
+            credentials: "same-origin",
+            signal: AbortSignal.timeout(timeout),
+        };
+        // Encode the request the way a native submit of this button would.
+        if (method === "GET") {
+            url.search = new URLSearchParams(data).toString();
+        } else if (enctype === "multipart/form-data") {
+            init.body = data;
+        } else {
+            init.body = new URLSearchParams(data);
+        }
+        const response = await fetch(url, init);
+        const html = await response.text();
+        return readDetails(new DOMParser().parseFromString(html, "text/html"), labels);
+    };
+    const results = new Array(buttons.length);
+    let next = 0;
+    const worker = async () => {
+        while (next < buttons.length) {
+            const i = next++;
+            const fileNumber = buttons[i].textContent.trim();
+            try {
+                results[i] = { fileNumber, ...(await fetchDetails(buttons[i])) };
+            } catch (error) {
+                results[i] = { fileNumber, error: String(error) };
+            }
+        }
+    };
+    await Promise.all(Array.from({ length: concurrency }, worker));
+    return results;
+}"""
+)
+
+# Resets the search form when it is rendered on the current page.
+_RESET_FORM_SCRIPT = """() => {
+    const form = document.querySelector('#FileSearchForm');
+    if (form) form.reset();
+    return form !== null;
+}"""
+
+
+class AttorneyInfo(NamedTuple):
+    """One scraped file history record, in CSV column order."""
+
+    county: Optional[str]
+    file_no: Optional[str]
+    proceeding: Optional[str]
+    attorney: Optional[str]
+    firm: Optional[str]
 
 
 class NewyorkCourtScraper:
@@ -18,6 +156,33 @@ class NewyorkCourtScraper:
         self.cdp_url = os.getenv("CDP_URL")
         self.max_navigation_retries = 3
         self.navigation_delay_seconds = 5
+        self.proceeding_types = (
+            "PROBATE & PRELIMINARY PETITIONS",
+            "ADMINISTRATION PETITION",
+        )
+        self.max_workers = 4
+        self.csv_flush_rows = 200
+        self._csv_fh = None
+        self._writer = None
+        self._rows_since_flush = 0
+        self.worker_stagger_seconds = 1
+        self.detail_concurrency = 8
+        self.row_queue = None
+        self.rows_scraped = 0
+        self.month_key = None
+        self.month_failed = False
+        self.cache_path = "scrape_cache.db"
+        self._cache = None
+        self._month_rows = {}
+        self._csv_is_new = False
+        self._saved_files = set()
+        self.action_timeout = 15000
+        self.navigation_timeout = 20000
+        self.detail_labels = (
+            "Proceeding:",
+            "Estate Attorney Firm:",
+            "Estate Attorney:",
+        )
 
     def connect_and_setup(self, p: sync_playwright) -> Page:
         """Connects to an already running Chrome instance via CDP and opens a new tab."""
@@ -25,133 +190,301 @@ class NewyorkCourtScraper:
         browser = p.chromium.connect_over_cdp(self.cdp_url)
         context = browser.contexts[0]
         page = context.new_page()
+        page.set_default_timeout(self.action_timeout)
+        page.set_default_navigation_timeout(self.navigation_timeout)
+        page.route("**/*", self.block_unneeded_resources)
         self.logger.info(
             f"Successfully connected and created new tab. Navigating to {self.search_url}"
         )
         return page
 
-    def get_attorney_info(
-        self, page: Page, scraped_data: list, county_name: str, month_name: str
-    ):
+    def block_unneeded_resources(self, route: Route):
+        """
+        Route handler that aborts images, stylesheets, fonts, media and analytics
+        requests. Only the HTML of the form, results and detail pages is read, so
+        these assets are never needed.
+        """
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+            domain in request.url for domain in _BLOCKED_DOMAINS
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    def get_attorney_info(self, page: Page, county_name: str, month_name: str):
         """
         Extracts attorney details from the current page of search results.
 
-        This function iterates through all file links on the results table, navigates
-        to the detailed file history page and then scrapes required data fields.
+        The file links of the results table are form submit buttons. Their forms are
+        submitted from inside the browser with `fetch()`, and each file history
+        response is read in place, so the results page is never left. The
+        `detail_concurrency` budget is shared by all `max_workers` worker processes,
+        so each tab runs its share of the requests at a time, and every request is
+        aborted after `navigation_timeout`. If the links cannot be submitted that way,
+        each one is clicked and its detail page scraped in the tab instead.
         """
 
         table_selector = "#NameResultsTable"
         link_selector = f"{table_selector} .ButtonAsLink"
 
         try:
-            page.wait_for_selector(table_selector, timeout=90000)
+            page.wait_for_selector(table_selector)
         except Exception:
             self.logger.warning(
                 "File Search results table not found. Cannot proceed with scraping details."
             )
+            self.month_failed = True
             return
 
         link_locators = page.locator(link_selector)
         try:
-            link_locators.first.wait_for(state="visible", timeout=90000)
+            link_locators.first.wait_for(state="visible")
 
             link_count = link_locators.count()
 
             self.logger.info(f"Found {link_count} file result links to process.")
-        except TimeoutError as e:
+        except PlaywrightTimeoutError as e:
             self.logger.error(
                 f"Timed out waiting for file result links: {e} (Selector: {link_selector}). Skipping this result set."
             )
+            self.month_failed = True
             return
 
-        for i in range(link_count):
-            current_link = page.locator(link_selector).nth(i)
-            current_link.wait_for(state="visible", timeout=60000)
-            file_number = current_link.text_content()
+        fetched_details = page.evaluate(
+            _FETCH_DETAILS_SCRIPT,
+            {
+                "selector": link_selector,
+                "labels": list(self.detail_labels),
+                "concurrency": max(1, self.detail_concurrency // self.max_workers),
+                "timeout": self.navigation_timeout,
+            },
+        )
+
+        if fetched_details is None:
+            self.logger.info(
+                "File links are not form buttons. Opening each file history page in the tab."
+            )
+            self.click_file_links(page, link_locators, county_name, month_name)
+        else:
+            for details in fetched_details:
+                if details.get("error") or not details.get("fileNo"):
+                    self.logger.error(
+                        f"Data extraction failed for File #: {details['fileNumber']} of county: {county_name} and month: {month_name}. Error: {details.get('error', 'file history fields not found')}"
+                    )
+                    self.month_failed = True
+                    continue
+
+                self.record_file_history(
+                    details["county"], details["fileNo"], details["values"]
+                )
+
+        self.logger.info(
+            "Checking pagination to see if there are additional pages to process"
+        )
+        self.get_next_page(page, county_name, month_name)
+
+    def click_file_links(
+        self, page: Page, link_locators, county_name: str, month_name: str
+    ):
+        """
+        Fallback of `get_attorney_info`: clicks each file link, scrapes the file
+        history page and returns to the results page.
+        """
+        # Search results reached through a GET query can be reloaded directly;
+        # POSTed result pages still need a history step back.
+        results_url = page.url
+        reload_results_directly = "?" in results_url
+
+        all_links = link_locators.all()
+        file_numbers = link_locators.evaluate_all("els => els.map(e => e.textContent)")
+
+        for i, (current_link, file_number) in enumerate(zip(all_links, file_numbers)):
+            try:
+                current_link.wait_for(state="visible")
+            except PlaywrightTimeoutError as e:
+                self.logger.error(
+                    f"Timed out waiting for file link {i + 1} of county: {county_name} and month: {month_name}. Skipping this file. Error: {e}"
+                )
+                self.month_failed = True
+                continue
             if not file_number:
                 self.logger.warning(
                     f"File Link not found for index {i + 1} of county: {county_name} and month {month_name}. Skipping this file."
                 )
+                self.month_failed = True
                 continue
             self.logger.info(f"Clicking link for File #: {file_number.strip()}")
 
             try:
-                with page.expect_navigation():
-                    current_link.click(timeout=90000)
+                with page.expect_navigation(wait_until="domcontentloaded"):
+                    current_link.click()
             except Exception as e:
                 self.logger.error(
                     f"Failed to click/navigate for File #: {file_number.strip()} of county: {county_name} and month is: {month_name}. Skipping. Error: {e}"
                 )
+                self.month_failed = True
                 continue
 
-            file_history_page = page.content()
-            soup = BeautifulSoup(file_history_page, "html.parser")
-            proceeding_type = None
-            estate_attorney = None
-            estate_attorney_firm = None
             file_no = None
 
             try:
-                county = soup.select_one("#Court").get("value")
-                file_no = soup.select_one("#FileNumber").get("value")
-
-                proceeding_label = soup.select_one('text:-soup-contains("Proceeding:")')
-                if proceeding_label:
-                    parent_tag = proceeding_label.find_parent("div", class_="col-sm-8")
-                    if parent_tag:
-                        value_element = parent_tag.select_one("div.col-sm-9 span text")
-                        if value_element:
-                            proceeding_type = value_element.text.strip()
-
-                attorney_element = soup.select_one(
-                    'text:-soup-contains("Estate Attorney:") > .BoldFont'
-                )
-                if attorney_element:
-                    estate_attorney = attorney_element.text.strip()
-
-                attorney_firm = soup.select_one(
-                    'text:-soup-contains("Estate Attorney Firm:") > text[style*="font-weight:bold"]'
-                )
-                if attorney_firm:
-                    estate_attorney_firm = attorney_firm.text.strip()
+                county, file_no, labeled_values = self.read_file_history(page)
 
             except Exception as e:
                 self.logger.error(
                     f"Data extraction failed for File #: {file_no or file_number.strip()} of county: {county_name} and month: {month_name}. Error: {e}"
                 )
-                continue
+                self.month_failed = True
+            else:
+                self.record_file_history(county, file_no, labeled_values)
 
-            attorney_info = {
-                "County": county,
-                "File Number": file_no,
-                "Proceeding Type": proceeding_type,
-                "Estate Attorney": estate_attorney,
-                "Estate Attorney Firm": estate_attorney_firm,
-            }
+            self.logger.info("Navigating back to the file search result page...")
+            try:
+                if reload_results_directly:
+                    page.goto(results_url, wait_until="domcontentloaded")
+                else:
+                    page.go_back(wait_until="domcontentloaded")
+            except PlaywrightTimeoutError as e:
+                self.logger.error(
+                    f"Timed out returning to the file search results of county: {county_name} and month: {month_name}. Skipping the remaining files of this page. Error: {e}"
+                )
+                self.month_failed = True
+                return
+
+    def record_file_history(self, county: str, file_no: str, labeled_values: dict):
+        """Builds the attorney record of one file history page and emits it."""
+        attorney_info = AttorneyInfo(
+            county,
+            file_no,
+            labeled_values.get("Proceeding:"),
+            labeled_values.get("Estate Attorney:"),
+            labeled_values.get("Estate Attorney Firm:"),
+        )
 
-            self.logger.info(
-                f"Successfully Scraped Attorney Info for file #: {file_no}"
+        self.logger.info(f"Successfully Scraped Attorney Info for file #: {file_no}")
+        self.emit_row(attorney_info)
+
+    def read_file_history(self, page: Page):
+        """
+        Reads the county, file number and labeled row values directly from the live
+        file history page.
+
+        The lookup mirrors `extract_labeled_values` but runs inside the browser via
+        `page.evaluate`, so only the extracted values are transferred. If the file
+        number could not be read, it falls back to parsing the page HTML with
+        `parse_file_history`.
+        """
+        details = page.evaluate(_DETAIL_SCRIPT, list(self.detail_labels))
+
+        if not details["fileNo"]:
+            self.logger.warning(
+                "File details not found in the live page. Falling back to HTML parsing."
             )
-            scraped_data.append(attorney_info)
+            return self.parse_file_history(page.content())
 
-            self.logger.info("Navigating back to the file search result page...")
-            page.go_back(timeout=90000)
+        return details["county"], details["fileNo"], details["values"]
 
-        self.logger.info(
-            "Checking pagination to see if there are additional pages to process"
+    def parse_file_history(self, file_history_page: str):
+        """
+        Parses the file history page and returns its county, file number and the
+        labeled row values. Uses selectolax when available, otherwise BeautifulSoup
+        (lxml backend) restricted to the page's form.
+        """
+        if LexborHTMLParser is None:
+            return self.parse_file_history_soup(file_history_page)
+
+        tree = LexborHTMLParser(file_history_page)
+        county = tree.css_first("#Court").attributes.get("value")
+        file_no = tree.css_first("#FileNumber").attributes.get("value")
+        return county, file_no, self.extract_labeled_values(tree)
+
+    def parse_file_history_soup(self, file_history_page: str):
+        """
+        BeautifulSoup fallback of `parse_file_history`. The labeled rows are indexed
+        in one pass, mirroring `extract_labeled_values`.
+        """
+        soup = BeautifulSoup(file_history_page, "lxml", parse_only=_DETAIL_STRAINER)
+        county = _COURT_SEL.select_one(soup).get("value")
+        file_no = _FILE_NUMBER_SEL.select_one(soup).get("value")
+
+        rows = {}
+        for row in soup.find_all("div", class_="col-sm-8"):
+            label_cell = row.find("div", class_="col-sm-3") or row
+            label = self.match_row_label(label_cell.get_text(separator=" ", strip=True))
+            if label:
+                rows.setdefault(label, row)
+
+        labeled_values = {}
+        for label, row in rows.items():
+            value_node = (
+                row.find(class_="BoldFont")
+                or row.find(style=_BOLD_STYLE_RE)
+                or row.find("div", class_="col-sm-9")
+            )
+            if value_node:
+                labeled_values[label] = value_node.get_text(separator=" ", strip=True)
+            else:
+                row_text = row.get_text(separator=" ", strip=True)
+                labeled_values[label] = row_text[len(label) :].strip()
+
+        return county, file_no, labeled_values
+
+    def get_county_options(self, page: Page) -> list:
+        """
+        Returns the (value, name) pairs of the county dropdown, skipping the placeholder.
+        The options are read by the browser in a single call, without serializing or
+        parsing the search page.
+        """
+        return page.eval_on_selector_all(
+            "#CourtSelect option",
+            "els => els.slice(1).map(e => [e.value, e.textContent.trim()])",
         )
-        self.get_next_page(page, scraped_data, county_name, month_name)
 
-    def get_next_page(
-        self, page: Page, scraped_data: list, county_name: str, month_name: str
-    ):
+    def match_row_label(self, label_text: str):
+        """Returns the detail label that `label_text` starts with, if any."""
+        for label in self.detail_labels:
+            if label_text.startswith(label):
+                return label
+        return None
+
+    def extract_labeled_values(self, tree) -> dict:
+        """
+        Reads the labeled rows of the file history page.
+
+        One pass over the `div.col-sm-8` rows indexes them by label (e.g. "Estate
+        Attorney:"), taken from the row's `div.col-sm-3` cell or the start of the row
+        text. Each wanted value is then a dict lookup: the row's bold element or its
+        `div.col-sm-9` cell, falling back to the text following the label.
+        """
+        rows = {}
+        for row in tree.css("div.col-sm-8"):
+            label_cell = row.css_first("div.col-sm-3") or row
+            label = self.match_row_label(label_cell.text(separator=" ", strip=True))
+            if label:
+                rows.setdefault(label, row)
+
+        labeled_values = {}
+        for label, row in rows.items():
+            value_node = (
+                row.css_first(".BoldFont")
+                or row.css_first('[style*="font-weight:bold"]')
+                or row.css_first("div.col-sm-9")
+            )
+            if value_node:
+                labeled_values[label] = value_node.text(separator=" ", strip=True)
+            else:
+                row_text = row.text(separator=" ", strip=True)
+                labeled_values[label] = row_text[len(label) :].strip()
+        return labeled_values
+
+    def get_next_page(self, page: Page, county_name: str, month_name: str):
         """
         Handles pagination for a given month's search results.
 
-        This function checks for the presence of subsequent result pages, iterates through
-        each non-active page link, clicks and waits for navigation, delegates the scraping
-        to `self.get_attorney_info()`, and uses `page.go_back()` to reset the browser state
-        for the next iteration.
+        This function checks for the presence of subsequent result pages, collects the
+        hrefs of all non-active page links in a single call, navigates to each page URL
+        directly and delegates the scraping to `self.get_attorney_info()`.
         """
 
         link_selector = "ul.pagination a.page-link:not(li.active a.page-link)"
@@ -160,32 +493,30 @@ class NewyorkCourtScraper:
         self.logger.info(
             "Checking pagination to see if there are additional pages to process"
         )
-        if pagination_locators.first.is_visible(timeout=60000):
-            total_pages_to_scrape = pagination_locators.count()
+        if pagination_locators.first.is_visible():
+            next_page_endpoints = pagination_locators.evaluate_all(
+                "els => els.map(e => e.getAttribute('href'))"
+            )
 
             self.logger.info(
-                f"Found {total_pages_to_scrape} subsequent pages for county: {county_name} and month: {month_name}."
+                f"Found {len(next_page_endpoints)} subsequent pages for county: {county_name} and month: {month_name}."
             )
-            for i in range(total_pages_to_scrape):
-                next_page_link = page.locator(link_selector).nth(i)
-                next_page_link.wait_for(state="visible", timeout=30000)
-                next_page_endpoint = next_page_link.get_attribute("href")
-                next_page_url = f"{self.base_url}{next_page_endpoint}"
+            for next_page_endpoint in next_page_endpoints:
+                next_page_url = f"{self.base_url}{next_page_endpoint}".strip()
                 self.logger.info(
-                    f"Navigating to page {next_page_url.strip()} for county: {county_name} and month: {month_name}."
+                    f"Navigating to page {next_page_url} for county: {county_name} and month: {month_name}."
                 )
 
                 try:
-                    with page.expect_navigation(wait_until="domcontentloaded"):
-                        next_page_link.click(timeout=30000)
+                    page.goto(next_page_url, wait_until="domcontentloaded")
                 except Exception as e:
                     self.logger.error(
-                        f"Failed to navigate to page {next_page_url.strip()} for county: {county_name} and month: {month_name}. Skipping. Error: {e}"
+                        f"Failed to navigate to page {next_page_url} for county: {county_name} and month: {month_name}. Skipping. Error: {e}"
                     )
+                    self.month_failed = True
                     continue
 
-                self.get_attorney_info(page, scraped_data, county_name, month_name)
-                page.go_back(timeout=90000)
+                self.get_attorney_info(page, county_name, month_name)
 
         else:
 
@@ -198,203 +529,474 @@ class NewyorkCourtScraper:
         """
         Generates a list of precise start and end dates for all 12 months of the specified year.
         """
-        monthly_ranges = []
-
-        start_date = datetime(year, 1, 1)
-
-        for month in range(12):
-            current_month_start = start_date + relativedelta(months=month)
-            current_month_end = start_date + relativedelta(months=month + 1, days=-1)
-
-            monthly_ranges.append(
-                {
-                    "month_name": current_month_start.strftime("%B"),
-                    "start_date": current_month_start.strftime("%m/%d/%Y"),
-                    "end_date": current_month_end.strftime("%m/%d/%Y"),
-                }
-            )
-
-        return monthly_ranges
+        return [
+            {
+                "month_name": calendar.month_name[month],
+                "start_date": f"{month:02d}/01/{year}",
+                "end_date": f"{month:02d}/{calendar.monthrange(year, month)[1]:02d}/{year}",
+            }
+            for month in range(1, 13)
+        ]
 
     def run(self):
         """
         Orchestrates the end-to-end data extraction from the New York State Unified Court System Records search form.
 
-        This function executes the complete scraping cycle by systematically iterating through
-        and applying complex filters: Proceeding Type, County, and granular monthly date ranges (2024).
-        It manages state across these loops, applies resilient navigation retry logic, handles
-        empty search results, processes multi-page pagination, and persists the final scraped
-        data to CSV, ensuring robust and complete data capture.
+        This function reads the county list once, then fans every (proceeding type, county)
+        combination out to a process pool. Each worker scrapes all granular monthly date
+        ranges (2024) for its combination through its own CDP connection and streams
+        every scraped record to the parent process, where a writer thread appends it to
+        the CSV as soon as it arrives. Months already completed by an earlier run are
+        skipped through the `scrape_cache.db` cache. The pool size bounds the
+        number of concurrent sessions against the portal. Workers log through a queue
+        to a listener in the parent, which is the only process writing the log files.
         """
         self.logger.info("Starting the New York Court script...")
 
+        # Workers are spawned rather than forked: the log listener and row writer
+        # threads are already running in this process.
+        mp_context = multiprocessing.get_context("spawn")
+        log_queue, log_listener = start_log_listener(mp_context)
+        row_queue = mp_context.Queue()
+        stagger_counter = mp_context.Value("i", 0)
+        row_writer = threading.Thread(target=self.write_rows, args=(row_queue,))
         try:
+            self.open_csv()
+            self._cache = shelve.open(self.cache_path)
             with sync_playwright() as p:
                 page = self.connect_and_setup(p)
+                page.goto(self.search_url, wait_until="domcontentloaded")
+                all_countys = self.get_county_options(page)
+                page.close()
 
-                target_year = 2024
-                monthly_ranges = self.generate_monthly_ranges(target_year)
-                page.goto(self.search_url, timeout=60000, wait_until="domcontentloaded")
-                response = page.content()
-                soup = BeautifulSoup(response, "html.parser")
+            target_year = 2024
+            monthly_ranges = self.generate_monthly_ranges(target_year)
+            tasks = self.plan_tasks(all_countys, monthly_ranges)
+            row_writer.start()
+
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=mp_context,
+                initializer=init_worker,
+                initargs=(
+                    log_queue,
+                    row_queue,
+                    stagger_counter,
+                    self.worker_stagger_seconds,
+                ),
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        scrape_county_task,
+                        county_value,
+                        county_name,
+                        proceeding_type_input,
+                        pending_ranges,
+                    ): (county_name, proceeding_type_input)
+                    for (
+                        county_value,
+                        county_name,
+                        proceeding_type_input,
+                        pending_ranges,
+                    ) in tasks
+                }
 
-                all_countys = soup.select("#CourtSelect option")[1:]
+                for future in as_completed(futures):
+                    county_name, proceeding_type_input = futures[future]
+                    try:
+                        rows_scraped = future.result()
+                    except Exception as e:
+                        self.logger.error(
+                            f"Scraping failed for county: {county_name} and proceeding type: {proceeding_type_input}. Error: {e}"
+                        )
+                        continue
 
-                count_proceeding_types = 0
-                while True:
-                    proceeding_type_input = "PROBATE & PRELIMINARY PETITIONS"
-                    if count_proceeding_types == 1:
-                        proceeding_type_input = "ADMINISTRATION PETITION"
-                    if count_proceeding_types > 1:
+                    if rows_scraped:
                         self.logger.info(
-                            "Scraped complete data for both proceeding types PROBATE & PRELIMINARY PETITIONS and ADMINISTRATION PETITIONS."
+                            f"Successfully Scraped {rows_scraped} records of county: {county_name} and its proceeding type: {proceeding_type_input}. For all months."
                         )
-                        break
-                    count_proceeding_types += 1
+                    else:
+                        self.logger.info(
+                            f"No data scraped for county: {county_name} and proceeding type: {proceeding_type_input}. Because no pagination links were found."
+                        )
+
+            self.logger.info(
+                "Scraped complete data for both proceeding types PROBATE & PRELIMINARY PETITIONS and ADMINISTRATION PETITIONS."
+            )
+            self.logger.info("Script finished successfully. Scraped all records.")
+
+        except Exception as e:
+            self.logger.error(f"\nFATAL ERROR during execution: {e}")
+
+            sys.exit(1)
+        finally:
+            if row_writer.is_alive():
+                row_queue.put(None)
+                row_writer.join()
+            self.close_csv()
+            if self._cache is not None:
+                self._cache.close()
+                self._cache = None
+            log_listener.stop()
+
+    def cache_key(
+        self, proceeding_type_input: str, county_value: str, range_info: dict
+    ) -> str:
+        """Returns the scrape cache key of one monthly search."""
+        return f"{proceeding_type_input}|{county_value}|{range_info['start_date']}|{range_info['end_date']}"
+
+    def plan_tasks(self, all_countys: list, monthly_ranges: list) -> list:
+        """
+        Builds the (county value, county name, proceeding type, pending ranges) tasks,
+        leaving out the months found in the scrape cache. Combinations with every
+        month cached are skipped entirely. The cached rows are replayed into the CSV
+        only when it was created by this run; otherwise they are already in it.
+        """
+        tasks = []
+        for proceeding_type_input in self.proceeding_types:
+            for county_value, county_name in all_countys:
+                pending_ranges = []
+                for range_info in monthly_ranges:
+                    key = self.cache_key(
+                        proceeding_type_input, county_value, range_info
+                    )
+                    if key not in self._cache:
+                        pending_ranges.append(range_info)
+                    elif self._csv_is_new:
+                        for row in self._cache[key]:
+                            self.save_row(row)
+
+                if pending_ranges:
+                    tasks.append(
+                        (
+                            county_value,
+                            county_name,
+                            proceeding_type_input,
+                            pending_ranges,
+                        )
+                    )
+                else:
                     self.logger.info(
-                        f"Start scraping for proceeding type: {proceeding_type_input}"
+                        f"All months of county: {county_name} and proceeding type: {proceeding_type_input} are cached. Skipping."
                     )
+        return tasks
 
-                    for county in all_countys:
-                        county_value = county.get("value")
-                        county_name = county.get_text(strip=True)
-                        scraped_data = []
-                        for range_info in monthly_ranges:
-
-                            for attempt in range(self.max_navigation_retries):
-                                try:
-                                    self.logger.info(
-                                        f"Navigation Attempt {attempt + 1}/{self.max_navigation_retries} to {self.search_url}"
-                                    )
-                                    page.goto(
-                                        self.search_url,
-                                        timeout=60000,
-                                        wait_until="domcontentloaded",
-                                    )
-                                    self.logger.info(
-                                        f"Navigated to search page: {page.url}"
-                                    )
-                                    break
-
-                                except Exception as e:
-                                    if attempt < self.max_navigation_retries - 1:
-                                        self.logger.warning(
-                                            f"Navigation failed ({e.__class__.__name__}). Retrying in {self.navigation_delay_seconds}s..."
-                                        )
-                                        time.sleep(self.navigation_delay_seconds)
-                                    else:
-                                        self.logger.critical(
-                                            f"FATAL ERROR: Navigation failed after {self.max_navigation_retries} attempts. Terminating script."
-                                        )
-                                        raise e
-
-                            self.logger.info(
-                                f"Attempting to fill the search form with county: {county_name} and proceeding type: {proceeding_type_input} and month: {range_info['month_name']}"
-                            )
-                            page.select_option("#CourtSelect", value=county_value)
-                            page.select_option(
-                                "#SelectedProceeding",
-                                value=proceeding_type_input,
-                            )
-
-                            page.type(
-                                "#txtFilingDateFrom",
-                                range_info["start_date"],
-                                delay=100,
-                            )
-                            page.type(
-                                "#txtFilingDateTo", range_info["end_date"], delay=100
-                            )
-
-                            with page.expect_navigation():
-                                self.logger.info("Clicking on the search button")
-                                page.locator("#FileSearchSubmit2").click()
-
-                            no_results_found = (
-                                page.locator(".validation-summary-errors")
-                                .filter(has_text="No Matching Files Were Found")
-                                .count()
-                                > 0
-                            )
-
-                            if no_results_found:
-                                self.logger.info(
-                                    f"No results found for county: {county_name} for month {range_info['month_name']} and proceeding type: {proceeding_type_input}."
-                                )
-                                continue
-
-                            self.logger.info(
-                                f"Navigated to file search results page: {page.url}"
-                            )
-                            self.get_attorney_info(
-                                page,
-                                scraped_data,
-                                county_name,
-                                range_info["month_name"],
-                            )
-
-                            self.logger.info(
-                                f"Completed processing for {range_info['month_name']} records of county: {county_name}."
-                            )
-
-                        if scraped_data:
-                            self.logger.info(
-                                f"Successfully Scraped data of county: {county_name} and its proceeding type: {proceeding_type_input}. For all months, Now Saving Data to CSV"
-                            )
-                            self.save_to_csv(scraped_data)
-                        else:
-                            self.logger.info(
-                                f"No data scraped for county: {county_name} and proceeding type: {proceeding_type_input}. Because no pagination links were found."
-                            )
+    def open_search_form(self, page: Page, county_name: str):
+        """
+        Navigates to the search form, retrying up to `max_navigation_retries` times
+        before abandoning the county.
+        """
+        for attempt in range(self.max_navigation_retries):
+            try:
+                self.logger.info(
+                    f"Navigation Attempt {attempt + 1}/{self.max_navigation_retries} to {self.search_url}"
+                )
+                page.goto(self.search_url, wait_until="domcontentloaded")
+                self.logger.info(f"Navigated to search page: {page.url}")
+                return
+
+            except Exception as e:
+                if attempt < self.max_navigation_retries - 1:
+                    self.logger.warning(
+                        f"Navigation failed ({e.__class__.__name__}). Retrying in {self.navigation_delay_seconds}s..."
+                    )
+                    time.sleep(self.navigation_delay_seconds)
+                else:
+                    self.logger.critical(
+                        f"Navigation failed after {self.max_navigation_retries} attempts. Abandoning county: {county_name}."
+                    )
+                    raise e
+
+    def reset_search_form(self, page: Page) -> bool:
+        """
+        Resets the search form in place when the current page still renders it (e.g.
+        after a search without results). Returns False when the form is not on the
+        page and the search URL has to be loaded again.
+        """
+        form_found = page.evaluate(_RESET_FORM_SCRIPT)
+        if form_found:
+            self.logger.info("Reset the search form in place.")
+        return form_found
+
+    def scrape_county(
+        self,
+        county_value: str,
+        county_name: str,
+        proceeding_type_input: str,
+        monthly_ranges: list,
+    ) -> int:
+        """
+        Scrapes every monthly date range of one county and proceeding type.
 
+        Opens its own Playwright driver, CDP connection and tab so it can run inside a
+        worker process. The search form is loaded once per county and reset in place
+        between months whenever it is still on the page; otherwise it is reloaded with
+        resilient navigation retry logic. Handles empty search results and multi-page
+        pagination, and returns the number of records scraped.
+        """
+        self.rows_scraped = 0
+        with sync_playwright() as p:
+            page = self.connect_and_setup(p)
+            try:
+                self.open_search_form(page, county_name)
+                for index, range_info in enumerate(monthly_ranges):
+                    self.month_key = self.cache_key(
+                        proceeding_type_input, county_value, range_info
+                    )
+                    self.month_failed = False
+                    try:
+                        self.scrape_month(
+                            page,
+                            index,
+                            county_value,
+                            county_name,
+                            proceeding_type_input,
+                            range_info,
+                        )
+                    except Exception:
+                        self.month_failed = True
+                        raise
+                    finally:
+                        self.complete_month()
+
+            finally:
                 page.close()
-                self.logger.info(
-                    "Tab closed. Script finished successfully. Scraped all records."
+
+        return self.rows_scraped
+
+    def scrape_month(
+        self,
+        page: Page,
+        index: int,
+        county_value: str,
+        county_name: str,
+        proceeding_type_input: str,
+        range_info: dict,
+    ):
+        """
+        Runs the search of one monthly date range and scrapes every page of its
+        results. Any file that could not be scraped sets `month_failed`, so the
+        month is not cached and is searched again by the next run.
+        """
+        if index and not self.reset_search_form(page):
+            self.open_search_form(page, county_name)
+
+        self.logger.info(
+            f"Attempting to fill the search form with county: {county_name} and proceeding type: {proceeding_type_input} and month: {range_info['month_name']}"
+        )
+        page.select_option("#CourtSelect", value=county_value)
+        page.select_option(
+            "#SelectedProceeding",
+            value=proceeding_type_input,
+        )
+
+        page.fill("#txtFilingDateFrom", range_info["start_date"])
+        page.fill("#txtFilingDateTo", range_info["end_date"])
+
+        try:
+            with page.expect_navigation(wait_until="domcontentloaded"):
+                self.logger.info("Clicking on the search button")
+                page.locator("#FileSearchSubmit2").click()
+        except PlaywrightTimeoutError as e:
+            self.logger.error(
+                f"Timed out searching county: {county_name} for month {range_info['month_name']} and proceeding type: {proceeding_type_input}. Skipping this month. Error: {e}"
+            )
+            self.month_failed = True
+            return
+
+        no_results_found = (
+            page.locator(".validation-summary-errors")
+            .filter(has_text="No Matching Files Were Found")
+            .count()
+            > 0
+        )
+
+        if no_results_found:
+            self.logger.info(
+                f"No results found for county: {county_name} for month {range_info['month_name']} and proceeding type: {proceeding_type_input}."
+            )
+            return
+
+        self.logger.info(f"Navigated to file search results page: {page.url}")
+        self.get_attorney_info(
+            page,
+            county_name,
+            range_info["month_name"],
+        )
+
+        self.logger.info(
+            f"Completed processing for {range_info['month_name']} records of county: {county_name}."
+        )
+
+    def open_csv(self):
+        """
+        Opens 'scraped_data.csv' once for the whole run with a large write buffer and
+        writes the header row if the file is empty. The county and file number of the
+        rows already in the file are loaded first, so a rerun never appends a record
+        twice.
+        """
+        self._saved_files = set()
+        if os.path.exists("scraped_data.csv"):
+            with open("scraped_data.csv", newline="", encoding="utf-8") as csvfile:
+                reader = csv.reader(csvfile)
+                next(reader, None)
+                self._saved_files.update(
+                    self.file_key(row) for row in reader if len(row) > 1
                 )
 
-        except Exception as e:
-            self.logger.error(f"\nFATAL ERROR during execution: {e}")
+        self._csv_fh = open(
+            "scraped_data.csv",
+            mode="a",
+            newline="",
+            encoding="utf-8",
+            buffering=1 << 20,
+        )
+        self._writer = csv.writer(self._csv_fh)
+        self._rows_since_flush = 0
+
+        self._csv_is_new = self._csv_fh.tell() == 0
+        if self._csv_is_new:
+            self._writer.writerow(
+                [
+                    "County",
+                    "File Number",
+                    "Proceeding Type",
+                    "Estate Attorney",
+                    "Estate Attorney Firm",
+                ]
+            )
 
-            sys.exit(1)
+    def close_csv(self):
+        """Flushes and closes the CSV handle opened by `open_csv`."""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._writer = None
+
+    def emit_row(self, row: AttorneyInfo):
+        """
+        Hands one scraped record over as a CSV row: to the parent process through
+        `row_queue` inside a pool worker, or straight to the CSV writer otherwise.
+        """
+        self.rows_scraped += 1
+        if self.row_queue is None:
+            self.save_row(row)
+        else:
+            # Plain tuples pickle without a reference to this module's class.
+            self.row_queue.put((self.month_key, tuple(row)))
 
-    def save_to_csv(self, scraped_data):
-        """Saves the scraped data to a CSV file."""
-        file_exists = os.path.exists("scraped_data.csv")
+    def complete_month(self):
+        """
+        Tells the parent process that the current month is done: True when every row
+        was sent and the month can be cached, False when it failed part-way and must
+        be searched again by the next run.
+        """
+        if self.month_failed:
+            self.logger.warning(
+                f"Month {self.month_key} was not scraped completely. It will not be cached."
+            )
+        if self.row_queue is not None:
+            self.row_queue.put((self.month_key, not self.month_failed))
 
+    def write_rows(self, row_queue):
+        """
+        Writer thread of the parent process. Saves the rows streamed by the workers
+        until the `None` sentinel is received, and caches each month once its
+        completion message arrives. The rows of a failed month are still saved but
+        not cached.
+        """
+        for month_key, row in iter(row_queue.get, None):
+            if row is True:
+                self.cache_month(month_key)
+            elif row is False:
+                self._month_rows.pop(month_key, None)
+            else:
+                self._month_rows.setdefault(month_key, []).append(row)
+                self.save_row(row)
+
+    def cache_month(self, month_key: str):
+        """
+        Stores the rows of a completed month in the scrape cache. The CSV is flushed
+        first, so a cached month's rows are always on disk.
+        """
         try:
-            with open(
-                "scraped_data.csv", mode="a", newline="", encoding="utf-8"
-            ) as csvfile:
-                writer = csv.writer(csvfile)
-
-                if not file_exists:
-                    writer.writerow(
-                        [
-                            "County",
-                            "File Number",
-                            "Proceeding Type",
-                            "Estate Attorney",
-                            "Estate Attorney Firm",
-                        ]
-                    )
+            self._csv_fh.flush()
+            self._rows_since_flush = 0
+            self._cache[month_key] = self._month_rows.pop(month_key, [])
+        except Exception as e:
+            self.logger.error(f"Error caching month {month_key}: {e}")
 
-                for item in scraped_data:
-                    writer.writerow(
-                        [
-                            item.get("County", ""),
-                            item.get("File Number", ""),
-                            item.get("Proceeding Type", ""),
-                            item.get("Estate Attorney", ""),
-                            item.get("Estate Attorney Firm", ""),
-                        ]
-                    )
+    @staticmethod
+    def file_key(row) -> tuple:
+        """Returns the (county, file number) pair that identifies a CSV row."""
+        return (row[0] or "", row[1] or "")
 
-            self.logger.info("Data successfully saved to scraped_data.csv")
+    def save_row(self, row: tuple):
+        """
+        Saves one row through the open CSV writer, skipping files that are already in
+        the CSV (e.g. from a month that was interrupted in an earlier run). The buffer
+        is flushed to disk every `csv_flush_rows` rows, bounding how much is lost if
+        the run is interrupted.
+        """
+        file_key = self.file_key(row)
+        if file_key in self._saved_files:
+            self.logger.info(
+                f"File #: {file_key[1]} of county: {file_key[0]} is already saved. Skipping."
+            )
+            return
+        self._saved_files.add(file_key)
+
+        try:
+            self._writer.writerow(row)
+
+            self._rows_since_flush += 1
+            if self._rows_since_flush >= self.csv_flush_rows:
+                self._csv_fh.flush()
+                self._rows_since_flush = 0
+                self.logger.info("Data successfully saved to scraped_data.csv")
 
         except Exception as e:
             self.logger.error(f"Error saving to CSV: {e}")
 
 
+_ROW_QUEUE = None
+
+
+def init_worker(log_queue, row_queue, stagger_counter, stagger_seconds):
+    """
+    Process pool initializer. Routes the worker's logging through `log_queue` and
+    keeps `row_queue` for streaming scraped rows back to the parent process. Each
+    worker takes the next slot from `stagger_counter` and delays its start-up by
+    `stagger_seconds` per slot, so the workers do not hit the portal at the same
+    instant.
+    """
+    global _ROW_QUEUE
+    setup_worker_logging(log_queue)
+    _ROW_QUEUE = row_queue
+
+    with stagger_counter.get_lock():
+        stagger_slot = stagger_counter.value
+        stagger_counter.value += 1
+    time.sleep(stagger_slot * stagger_seconds)
+
+
+def scrape_county_task(
+    county_value: str,
+    county_name: str,
+    proceeding_type_input: str,
+    monthly_ranges: list,
+) -> int:
+    """
+    Process pool entry point. Builds a scraper in the worker process and scrapes one
+    county/proceeding type combination, streaming its rows to the parent.
+    """
+    scraper = NewyorkCourtScraper()
+    scraper.row_queue = _ROW_QUEUE
+    return scraper.scrape_county(
+        county_value, county_name, proceeding_type_input, monthly_ranges
+    )
+
+
 if __name__ == "__main__":
     scraper = NewyorkCourtScraper()
     scraper.run()
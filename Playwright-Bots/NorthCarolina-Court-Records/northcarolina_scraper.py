@@ -1,13 +1,33 @@
 import csv
 import os
+import shutil
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import List, Dict
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from requests.adapters import HTTPAdapter
+import orjson
 from logger import setup_logging
-from playwright.sync_api import sync_playwright
-
-from twocaptcha import TwoCaptcha
+from playwright.sync_api import (
+    sync_playwright,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+# Reads the case link of every Kendo grid row that holds a case (detail rows are
+# excluded) and returns only the fields the case scraper needs.
+_CASE_LINKS_SCRIPT = """
+rows => rows
+    .map(row => row.querySelector('.caseLink'))
+    .filter(link => link !== null)
+    .map(link => ({url: link.dataset.url, no: link.textContent.trim()}))
+"""
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "stylesheet", "font", "media"})
+# reCAPTCHA must load completely for the widget to accept the injected token.
+_ALLOWED_URL_MARKERS = ("recaptcha",)
 
 
 class NorthCarolinaScraper:
@@ -15,183 +35,386 @@ class NorthCarolinaScraper:
     def __init__(self):
         self.base_url = "https://portal-nc.tylertech.cloud"
         self.search_url = "{base_url}/Portal/Home/Dashboard/29"
+        self._pdf_tmpl = (
+            self.base_url
+            + "/app/RegisterOfActionsService/CaseEvents('%s')?mode=portalembed&$top=50&$skip=0"
+        )
+        self._parties_tmpl = (
+            self.base_url
+            + "/app/RegisterOfActionsService/Parties('%s')?mode=portalembed&$top=50&$skip=0"
+        )
+        self._types_tmpl = (
+            self.base_url + "/app/RegisterOfActionsService/CaseSummariesSlim?key=%s"
+        )
         self.api_key = os.getenv("API_KEY")
-        self.solver = TwoCaptcha(self.api_key)
+        self.captcha_api_url = "https://2captcha.com"
+        self.captcha_initial_wait = 15
+        self.captcha_poll_interval = 5
+        self.captcha_timeout = 180
         self.logger = setup_logging()
-        self.scraped_data = []
+        self.csv_path = os.path.join("Scraped Data", "scraped_data.csv")
+        self.partial_csv_path = self.csv_path + ".tmp"
+        self.state_path = "state.json"
+        self.pdf_folder = os.path.join("Scraped Data", "Scraped PDF's")
+        self.max_attorney_columns = 10
+        self.csv_flush_rows = 50
+        self._csv_fh = None
+        self._writer = None
+        self._rows_since_flush = 0
+        self._max_attorneys_seen = 0
+        self.records_saved = 0
+        self.request_timeout = 30
+        self.case_workers = 8
+        self.download_workers = 4
+        self._download_executor = ThreadPoolExecutor(max_workers=self.download_workers)
+        self.download_chunk_size = 256 * 1024
+        self._sitekey = None
+        self.token_max_age = 100
+        self._captcha_executor = ThreadPoolExecutor(max_workers=1)
+        self._captcha_stop = threading.Event()
+        self.session = requests.Session()
+        # The RegisterOfActions JSON is verbose, so Brotli is accepted as well;
+        # urllib3 decodes `br` responses through the `brotli` package.
+        self.session.headers["Accept-Encoding"] = "gzip, deflate, br"
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=0),
+        )
 
     def solve_recaptcha_v2(self, url, sitekey):
-        """Sends sitekey and URL to 2Captcha and returns the g-recaptcha-response token."""
+        """
+        Submits the sitekey and URL to 2Captcha's `in.php` endpoint and polls
+        `res.php` through the pooled session until the g-recaptcha-response token
+        is ready. Returns the token, or None if the task failed, timed out or was
+        stopped through `_captcha_stop` because the run is shutting down.
+        """
+        if self._captcha_stop.is_set():
+            return None
         self.logger.info("Sending reCAPTCHA V2 task to 2Captcha...")
         try:
-            result = self.solver.recaptcha(sitekey=sitekey, url=url)
-            self.logger.info("reCAPTCHA Solved. Token received.")
-            return result.get("code")
+            submitted = self.session.post(
+                f"{self.captcha_api_url}/in.php",
+                data={
+                    "key": self.api_key,
+                    "method": "userrecaptcha",
+                    "googlekey": sitekey,
+                    "pageurl": url,
+                    "json": 1,
+                },
+                timeout=self.request_timeout,
+            ).json()
+            if submitted.get("status") != 1:
+                raise RuntimeError(submitted.get("request"))
+            captcha_id = submitted["request"]
+
+            if self._captcha_stop.wait(self.captcha_initial_wait):
+                self.logger.info("reCAPTCHA solve stopped: the run is shutting down.")
+                return None
+            deadline = time.monotonic() + self.captcha_timeout
+            while time.monotonic() < deadline:
+                result = self.session.get(
+                    f"{self.captcha_api_url}/res.php",
+                    params={
+                        "key": self.api_key,
+                        "action": "get",
+                        "id": captcha_id,
+                        "json": 1,
+                    },
+                    timeout=self.request_timeout,
+                ).json()
+                if result.get("status") == 1:
+                    self.logger.info("reCAPTCHA Solved. Token received.")
+                    return result.get("request")
+                if result.get("request") != "CAPCHA_NOT_READY":
+                    raise RuntimeError(result.get("request"))
+                if self._captcha_stop.wait(self.captcha_poll_interval):
+                    self.logger.info(
+                        "reCAPTCHA solve stopped: the run is shutting down."
+                    )
+                    return None
+
+            raise TimeoutError(
+                f"task {captcha_id} not solved within {self.captcha_timeout}s"
+            )
         except Exception as e:
             self.logger.error(f"Error solving reCAPTCHA: {e}")
             return None
 
+    def request_captcha_token(self, url):
+        """
+        Starts solving a reCAPTCHA token in the background and returns its future,
+        so the 2Captcha round-trip overlaps with scraping the current results.
+        """
+        return self._captcha_executor.submit(self._solve_timed, url, self._sitekey)
+
+    def _solve_timed(self, url, sitekey):
+        """Solves a token and returns it with the monotonic time it was received."""
+        return self.solve_recaptcha_v2(url, sitekey), time.monotonic()
+
+    def take_captcha_token(self, pending_token, url):
+        """
+        Waits for a prefetched token. reCAPTCHA tokens expire after about two
+        minutes, so a token older than `token_max_age` seconds is replaced by a
+        freshly solved one.
+        """
+        captcha_token, solved_at = pending_token.result()
+        if captcha_token and time.monotonic() - solved_at > self.token_max_age:
+            self.logger.info("Prefetched reCAPTCHA token expired. Solving a new one.")
+            captcha_token, _ = self._solve_timed(url, self._sitekey)
+        return captcha_token
+
+    def block_unneeded_resources(self, route: Route):
+        """
+        Route handler that aborts images, stylesheets, fonts and media. Only the
+        DOM and the API JSON are read, so these assets are never needed; anything
+        served for reCAPTCHA is always let through.
+        """
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES and not any(
+            marker in request.url for marker in _ALLOWED_URL_MARKERS
+        ):
+            route.abort()
+        else:
+            route.continue_()
+
+    def load_storage_state(self):
+        """
+        Returns the path of the browser session state saved by the previous run,
+        so the new context starts with its portal and reCAPTCHA cookies and local
+        storage, or None on the first run.
+        """
+        if os.path.exists(self.state_path):
+            self.logger.info(f"Reusing browser session state from {self.state_path}")
+            return self.state_path
+        return None
+
     def run(self):
         """
         Executes the main scraping workflow:
         - Launches browser and loads the court search page.
         - Iteratively generates record numbers and fills them into the search form.
-        - Extracts the page’s reCAPTCHA site-key, sends it with the URL to 2Captcha,
-        receives the solved token, and injects it into the hidden CAPTCHA field.
+        - Reads the page’s reCAPTCHA site-key once, sends it with the URL to 2Captcha,
+        receives the solved token, and injects it into the hidden CAPTCHA field. The
+        token for the next search is solved in the background while the current
+        results are scraped.
         - Submits the search request and waits for the results grid to load.
         - Sets the page size to 200 using page.evaluate(), required because the
         Kendo UI dropdown hides its <select> element and cannot be clicked normally.
-        - Parses the loaded results, collects all case rows, and sends them to the
-        case-scraper.
-        - Loops through all records, navigating back between searches, and finally
-        saves all scraped data to CSV.
+        - Reads the link URL and case number of every result row in the page, and
+        sends them to the case-scraper.
+        - Loops through all records, navigating back between searches. Every record
+        is written to the CSV as soon as its case is scraped.
         """
         record_num = 0
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            url = self.search_url.format(base_url=self.base_url)
-            page.goto(url, wait_until="load")
-            self.logger.info(f"Navigated to: {url}")
-
-            while True:
-                foramtted_record_num = f"{record_num:02d}"
-                record_number = f"24E00{foramtted_record_num}*"
-                self.logger.info(f"Searching Record Number {record_number}")
-                response = page.content()
-                soup = BeautifulSoup(response, "html.parser")
-
-                data_site_key = soup.select_one(".g-recaptcha").get("data-sitekey")
-
-                record_input = "#caseCriteria_SearchCriteria"
-
-                page.fill(record_input, record_number)
-                captcha_token = self.solve_recaptcha_v2(url, data_site_key)
-                time.sleep(0.5)
-                recaptcha_input = "#g-recaptcha-response"
-                page.evaluate(
-                    f"document.querySelector('{recaptcha_input}').value = '{captcha_token}';"
-                )
-                time.sleep(0.5)
-                submit_button = "#btnSSSubmit"
-                page.click(
-                    selector=submit_button,
-                    timeout=30000,
-                )
-
-                record_num += 2
-                self.logger.info(
-                    "Token injected successfully. Clicking on submit button"
-                )
-                self.logger.info(f"Navigation complete. Current URL: {page.url}")
-                time.sleep(0.5)
-                no_cases_locator = page.locator("#ui-tabs-1 .portlet-body p")
-                no_cases_locator.wait_for(state="visible", timeout=90000)
-                if no_cases_locator.is_visible():
-                    message_text = no_cases_locator.inner_text().strip()
+        completed = False
+        try:
+            self.open_csv()
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=True)
+                context = browser.new_context(storage_state=self.load_storage_state())
+                try:
+                    page = context.new_page()
+                    page.route("**/*", self.block_unneeded_resources)
+                    url = self.search_url.format(base_url=self.base_url)
+                    page.goto(url, wait_until="load")
+                    self.logger.info(f"Navigated to: {url}")
+
+                    # The reCAPTCHA site-key is fixed for the portal, so it is read once.
+                    self._sitekey = page.get_attribute(".g-recaptcha", "data-sitekey")
+                    pending_token = self.request_captcha_token(url)
+
+                    while True:
+                        foramtted_record_num = f"{record_num:02d}"
+                        record_number = f"24E00{foramtted_record_num}*"
+                        self.logger.info(f"Searching Record Number {record_number}")
+                        record_input = "#caseCriteria_SearchCriteria"
+
+                        page.fill(record_input, record_number)
+                        captcha_token = self.take_captcha_token(pending_token, url)
+                        recaptcha_input = "#g-recaptcha-response"
+                        page.evaluate(
+                            f"document.querySelector('{recaptcha_input}').value = '{captcha_token}';"
+                        )
+                        submit_button = "#btnSSSubmit"
+                        with page.expect_navigation(wait_until="domcontentloaded"):
+                            page.click(
+                                selector=submit_button,
+                                timeout=30000,
+                            )
 
-                    if "No cases match your search" in message_text:
+                        record_num += 2
                         self.logger.info(
-                            f"No cases found for search query: {record_number}"
+                            "Token injected successfully. Clicking on submit button"
                         )
                         self.logger.info(
-                            "Scraping process has completed. No further results are available."
+                            f"Navigation complete. Current URL: {page.url}"
                         )
-                        break
+                        no_cases_locator = page.locator("#ui-tabs-1 .portlet-body p")
+                        no_cases_locator.wait_for(state="visible", timeout=90000)
+                        if no_cases_locator.is_visible():
+                            message_text = no_cases_locator.inner_text().strip()
+
+                            if "No cases match your search" in message_text:
+                                self.logger.info(
+                                    f"No cases found for search query: {record_number}"
+                                )
+                                self.logger.info(
+                                    "Scraping process has completed. No further results are available."
+                                )
+                                break
 
-                page.wait_for_selector("#CasesGrid tbody tr", timeout=90000)
+                        pending_token = self.request_captcha_token(url)
+                        page.wait_for_selector("#CasesGrid tbody tr", timeout=90000)
 
-                dropdown_selector = "span.k-widget.k-dropdown span.k-dropdown-wrap"
-                locate_dropdown = page.locator(dropdown_selector)
+                        dropdown_selector = (
+                            "span.k-widget.k-dropdown span.k-dropdown-wrap"
+                        )
+                        locate_dropdown = page.locator(dropdown_selector)
 
-                if locate_dropdown.is_visible():
-                    page.click(dropdown_selector)
-                    time.sleep(0.5)
+                        if locate_dropdown.is_visible():
+                            page.click(dropdown_selector)
 
-                    option_selector = 'li:has-text("200")'
-                    option_element_handle = page.locator(
-                        option_selector
-                    ).element_handle()
+                            option_locator = page.locator('li:has-text("200")')
+                            try:
+                                option_locator.wait_for(state="visible", timeout=5000)
+                                option_element_handle = option_locator.element_handle()
+                            except PlaywrightTimeoutError:
+                                option_element_handle = None
 
-                    if option_element_handle:
+                            if option_element_handle:
 
-                        page.evaluate(
-                            "element => element.click()", option_element_handle
+                                page.evaluate(
+                                    "element => element.click()", option_element_handle
+                                )
+                                self.logger.info(
+                                    "Pagination control interacted. Product view successfully updated to display the maximum capacity (200 items)."
+                                )
+                            else:
+                                self.logger.error(
+                                    "Pagination failure: Required element for setting '200 items per page' was not found on the current view."
+                                )
+                        else:
+                            self.logger.info(
+                                f"Dropdown not found may be records are less than 10 for search query: {record_number}"
+                            )
+                        all_cases = page.eval_on_selector_all(
+                            "#CasesGrid tr.k-master-row", _CASE_LINKS_SCRIPT
                         )
+
+                        self.scrape_cases(all_cases)
                         self.logger.info(
-                            "Pagination control interacted. Product view successfully updated to display the maximum capacity (200 items)."
+                            f"Successfully scraped and saved complete data of search query: {record_number}."
                         )
-                    else:
+                        page.go_back()
+                        self.logger.info(f"Navigated Back to: {url}")
+                        self.logger.info("Now searching next record number.")
+                finally:
+                    try:
+                        context.storage_state(path=self.state_path)
+                        self.logger.info(
+                            f"Saved browser session state to {self.state_path}"
+                        )
+                    except Exception as e:
                         self.logger.error(
-                            "Pagination failure: Required element for setting '200 items per page' was not found on the current view."
+                            f"Could not save browser session state to {self.state_path}: {e}"
                         )
-                else:
-                    self.logger.info(
-                        f"Dropdown not found may be records are less than 10 for search query: {record_number}"
-                    )
-                html = page.locator("#CasesGrid").inner_html()
-                cases_soup = BeautifulSoup(html, "html.parser")
-                all_cases = cases_soup.select(".k-master-row")
-
-                self.scrape_cases(all_cases)
-                self.logger.info(
-                    f"Successfully scraped complete data of search query: {record_number}. Now saving the data in csv file."
-                )
-                page.go_back()
-                self.logger.info(f"Navigated Back to: {url}")
-                self.logger.info("Now searching next record number.")
-
-            self.save_to_csv(self.scraped_data)
+            completed = True
+        finally:
+            # Stop any prefetched solve before the session it polls through closes.
+            self._captcha_stop.set()
+            self._captcha_executor.shutdown(wait=True)
+            self._download_executor.shutdown(wait=True)
+            self.close_csv(completed)
+            self.session.close()
 
     def scrape_cases(self, all_cases):
         """
-        Iterates through all scraped case entries, extracts each case’s ID,
-        builds required API endpoints, determines case type, and skips cases
-        that match exclusion criteria. Fetches attorney details and PDF
-        availability through API calls, then compiles the finalized structured
-        record for each valid case and adds it to the master dataset.
+        Iterates through all scraped case entries and hands each one to
+        `_process_case`. Cases are processed concurrently by up to `case_workers`
+        threads sharing the pooled session, since each case is a chain of
+        independent API round-trips. Valid records are written to the CSV in their
+        grid order.
         """
         records = 0
-        for case in all_cases:
-            case_url = case.select_one(".caseLink").get("data-url")
-            case_no = case.select_one(".caseLink").get_text(strip=True)
-            case_api_id = case_url.split("?id=")[1].split("&")[0]
+        with ThreadPoolExecutor(max_workers=self.case_workers) as executor:
+            for new_dict in executor.map(self._process_case, all_cases):
+                if new_dict is not None:
+                    self.save_row(new_dict)
+                    records += 1
 
-            case_pdf_api = f"{self.base_url}/app/RegisterOfActionsService/CaseEvents('{case_api_id}')?mode=portalembed&$top=50&$skip=0"
-            complete_case_url = f"{self.base_url}/app/RegisterOfActionsService/Parties('{case_api_id}')?mode=portalembed&$top=50&$skip=0"
-            case_type_url = f"{self.base_url}/app/RegisterOfActionsService/CaseSummariesSlim?key={case_api_id}"
+    def _process_case(self, case):
+        """
+        Takes a case's link URL and number as read from the grid, extracts the
+        case's ID, builds the required API endpoints, determines the
+        case type and skips cases that match exclusion criteria or whose case type
+        cannot be fetched (returning None), so one failing case never aborts the
+        rest of the results page.
+        Fetches attorney details and PDF availability through API calls, then
+        returns the finalized structured record.
+        """
+        case_url = case["url"]
+        case_no = case["no"]
+        case_api_id = case_url.split("?id=")[1].split("&")[0]
 
-            self.logger.info(
-                f"Sending Request to check case type from API: {case_type_url}"
-            )
-            case_type_response = requests.get(case_type_url)
-            case_type_json = case_type_response.json()
+        case_pdf_api = self._pdf_tmpl % case_api_id
+        complete_case_url = self._parties_tmpl % case_api_id
+        case_type_url = self._types_tmpl % case_api_id
 
-            check_case_type = (
-                case_type_json.get("CaseInformation", {})
-                .get("CaseType", {})
-                .get("Description")
+        self.logger.info(
+            f"Sending Request to check case type from API: {case_type_url}"
+        )
+        try:
+            case_type_response = self.session.get(
+                case_type_url, timeout=self.request_timeout
             )
-            if check_case_type == "Decedents' Estate - Small Estate":
-                self.logger.info(
-                    f"Skipping the Case {case_no} because Case Type is: {check_case_type}"
-                )
-                continue
-
-            attorney_info = self.get_attorney_info(complete_case_url)
-            pdf_found = self.get_pdf_files(case_pdf_api, case_no)
-            new_dict = {
-                "Case Number": case_no,
-                "Case Type": check_case_type,
-                "Attorney Info": attorney_info,
-                "PDF File": "Found" if pdf_found else "Not Found",
-            }
+            case_type_json = orjson.loads(case_type_response.content)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            self.logger.error(
+                f"Request error when fetching case type of case {case_no}: {e}. Skipping this case."
+            )
+            return None
+
+        check_case_type = self._dig(
+            case_type_json, "CaseInformation", "CaseType", "Description"
+        )
+        if check_case_type == "Decedents' Estate - Small Estate":
             self.logger.info(
-                f"Successfully Scraped the case no: {case_no} and its URL: {self.base_url}/{case_url}"
+                f"Skipping the Case {case_no} because Case Type is: {check_case_type}"
             )
-            print(new_dict)
-            self.scraped_data.append(new_dict)
-            records += 1
+            return None
+
+        attorney_info = self.get_attorney_info(complete_case_url)
+        pdf_found = self.get_pdf_files(case_pdf_api, case_no)
+        new_dict = {
+            "Case Number": case_no,
+            "Case Type": check_case_type,
+            "Attorney Info": attorney_info,
+            "PDF File": "Found" if pdf_found else "Not Found",
+        }
+        self.logger.info(
+            f"Successfully Scraped the case no: {case_no} and its URL: {self.base_url}/{case_url}"
+        )
+        print(new_dict)
+        return new_dict
+
+    @staticmethod
+    def _dig(data, *keys, default=None):
+        """
+        Walks a path of dict keys and list indexes through decoded API JSON and
+        returns the value at the end, or `default` as soon as a step is missing.
+        Replaces `.get("X", {}).get("Y", {})` chains without allocating a
+        throwaway dict for every missing level.
+        """
+        for key in keys:
+            if isinstance(data, dict):
+                data = data.get(key)
+            elif isinstance(data, list) and isinstance(key, int):
+                data = data[key] if -len(data) <= key < len(data) else None
+            else:
+                return default
+            if data is None:
+                return default
+        return data
 
     def get_pdf_files(self, case_pdf_api, case_no):
         """
@@ -205,30 +428,32 @@ class NorthCarolinaScraper:
         """
         try:
             self.logger.info(f"For PDF URL info Sending Request to API: {case_pdf_api}")
-            response = requests.get(case_pdf_api)
+            response = self.session.get(case_pdf_api, timeout=self.request_timeout)
             self.logger.info(
                 "Request Successful Now Extracting relevant document name, type, id's to construct the PDF URL."
             )
-            json_data = response.json()
+            json_data = orjson.loads(response.content)
 
             pdf_found = False
-            files_downloaded = []
+            files_downloaded = set()
+            business_folder = os.path.join(self.pdf_folder, case_no)
             all_case_events = json_data.get("Events", [])
             if all_case_events:
                 for case_event in all_case_events:
-                    event_name = (
-                        case_event.get("Event", {}).get("TypeId", {}).get("Description")
+                    event_name = self._dig(
+                        case_event, "Event", "TypeId", "Description", default=""
                     )
                     if "Bond" in event_name:
-                        event = case_event.get("Event", {}).get("Documents", [])
-                        if event:
-                            event = event[0]
-                        else:
+                        event = self._dig(case_event, "Event", "Documents", 0)
+                        if not event:
                             continue
-                        doc_id = (
-                            event.get("DocumentVersions", [])[0]
-                            .get("DocumentFragments", [])[0]
-                            .get("DocumentFragmentID")
+                        doc_id = self._dig(
+                            event,
+                            "DocumentVersions",
+                            0,
+                            "DocumentFragments",
+                            0,
+                            "DocumentFragmentID",
                         )
 
                         doc_data = event.get("DocumentTypeID", {})
@@ -244,16 +469,14 @@ class NorthCarolinaScraper:
                                 f"{formatted_file_name} is already downloaded for case: {case_no}. Skipping this file."
                             )
                             continue
-                        files_downloaded.append(formatted_file_name)
-                        folder_name1 = "Scraped Data"
-                        folder_name2 = "Scraped PDF's"
-                        folder_name = os.path.join(folder_name1, folder_name2)
-                        business_folder = os.path.join(folder_name, case_no)
-                        os.makedirs(business_folder, exist_ok=True)
+                        if not files_downloaded:
+                            os.makedirs(business_folder, exist_ok=True)
+                        files_downloaded.add(formatted_file_name)
 
                         filename = f"{formatted_file_name}.pdf"
                         file_path = os.path.join(business_folder, filename)
 
+                        candidate_urls = []
                         parent_links = event.get("ParentLinks", [])
                         for link in parent_links:
                             location_id = link.get("NodeID")
@@ -263,49 +486,100 @@ class NorthCarolinaScraper:
                             self.logger.info(
                                 f"Using different document name, type, id's and case ids. We have successfully constructed the pdf URL: {case_pdf_url}"
                             )
-                            pdf_found = self.download_file(
-                                case_pdf_url, file_path, filename
+                            candidate_urls.append(case_pdf_url)
+
+                        if self.download_first(candidate_urls, file_path, filename):
+                            pdf_found = True
+                        else:
+                            self.logger.info(
+                                f"File {filename} not downloaded from any of its {len(candidate_urls)} parent case links for case: {case_no}."
                             )
-                            if pdf_found:
-                                break
-                            else:
-                                self.logger.info(
-                                    f"File Not downloaded. Trying with case id: {case_id} and location id: {location_id} now."
-                                )
             if not pdf_found:
                 self.logger.info(f"PDF not found for case: {case_no}")
             else:
                 self.logger.info(f"PDF found for case: {case_no}")
             return pdf_found
 
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             self.logger.error(
                 f"Request error when fetching case {case_no} PDF info: {e}."
             )
             return False
 
+    def download_first(self, urls, filepath, filename):
+        """
+        Downloads the same document from each candidate URL in parallel on the
+        download pool and keeps the first copy that succeeds. Each attempt writes
+        to its own `.partN` file; the winner is renamed to `filepath`, pending
+        attempts are cancelled and every other partial file is removed as soon as
+        its attempt finishes. Returns whether any attempt succeeded.
+        """
+        pending = {}
+        for index, url in enumerate(urls):
+            part_path = f"{filepath}.part{index}"
+            future = self._download_executor.submit(
+                self.download_file, url, part_path, filename
+            )
+            pending[future] = part_path
+
+        winner = None
+        while pending and winner is None:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                part_path = pending.pop(future)
+                try:
+                    downloaded = future.result()
+                except requests.RequestException as e:
+                    self.logger.error(f"Download of {filename} failed: {e}")
+                    downloaded = False
+                if downloaded and winner is None:
+                    winner = part_path
+                else:
+                    self._remove_file(part_path)
+
+        for future, part_path in pending.items():
+            future.cancel()
+            future.add_done_callback(
+                lambda _, part_path=part_path: self._remove_file(part_path)
+            )
+
+        if winner is None:
+            return False
+        os.replace(winner, filepath)
+        return True
+
+    @staticmethod
+    def _remove_file(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
     def download_file(self, url, filepath, filename, retries=2):
         """
         Attempts to download a file from the specified URL and save
-        it to the given local filepath. Streams the content in chunks
-        to efficiently handle large files. Will retry the download up
+        it to the given local filepath. Streams the raw response into
+        the file with `shutil.copyfileobj` in 256 KiB blocks to
+        efficiently handle large files. Will retry the download up
         to 2 times in case of network or connection errors, logging each
         attempt.
         """
 
         for attempt in range(retries):
             try:
-                with requests.get(url, stream=True, timeout=30) as res:
+                with self.session.get(
+                    url, stream=True, timeout=self.request_timeout
+                ) as res:
                     res.raise_for_status()
+                    res.raw.decode_content = True
                     with open(filepath, "wb") as f:
-                        for chunk in res.iter_content(8192):
-                            if chunk:
-                                f.write(chunk)
+                        shutil.copyfileobj(res.raw, f, length=self.download_chunk_size)
                         self.logger.info(f"Successfully Downloaded file: {filename}")
                 return True
             except (
                 requests.exceptions.ChunkedEncodingError,
                 requests.exceptions.ConnectionError,
+                urllib3.exceptions.HTTPError,
             ) as e:
                 self.logger.error(
                     f"Download failed ({e}), retrying {attempt + 1}/{retries}..."
@@ -323,12 +597,13 @@ class NorthCarolinaScraper:
         """
         self.logger.info(f"Sending Request to get attorney info from API: {case_url}")
         try:
-            response = requests.get(case_url)
+            response = self.session.get(case_url, timeout=self.request_timeout)
             self.logger.info(f"Request Successfull to attorney info API: {case_url}")
-            json_data = response.json()
+            json_data = orjson.loads(response.content)
             all_parties = json_data.get("Parties", [])
             attorney_info_len = 0
             attorneys = []
+            seen_names = set()
             for party in all_parties:
                 attorney_info = party.get("CasePartyAttorneys", [])
                 if attorney_info:
@@ -384,87 +659,121 @@ class NorthCarolinaScraper:
                                     attorney_addresses if attorney_addresses else ""
                                 ),
                             }
-                            if not any(
-                                key.get("AttorneyName") == attorney_name
-                                for key in attorneys
-                            ):
+                            if attorney_name not in seen_names:
+                                seen_names.add(attorney_name)
                                 attorneys.append(attorney_complete_info)
 
             return attorneys
-        except requests.RequestException as e:
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
             print(f"Request error when fetching attorney info: {e}")
             return []
 
-    def _get_max_attorneys_in_batch(self, scraped_data):
+    def _build_headers(self, attorney_columns):
+        """Returns the CSV header with `attorney_columns` name/address column pairs."""
+        headers = ["Case Number", "Case Type", "PDF File"]
+        for i in range(1, attorney_columns + 1):
+            headers.extend([f"Attorney Name {i}", f"Attorney Address {i}"])
+        return headers
+
+    def open_csv(self):
         """
-        Calculates the maximum number of attorney entries in the current batch.
+        Opens the CSV once for the whole run and writes the header up front, with
+        `max_attorney_columns` reserved attorney name/address column pairs. Rows
+        are written with a `csv.DictWriter` that fills unused columns with "".
+        Records are streamed to `partial_csv_path`, so the previous run's CSV is
+        left intact until `close_csv` replaces it.
         """
-
-        max_attorneys = 0
-        for item in scraped_data:
-            attorney_info = item.get("Attorney Info", [])
-            if isinstance(attorney_info, list):
-                max_attorneys = max(max_attorneys, len(attorney_info))
-        return max_attorneys
-
-    def save_to_csv(self, scraped_data):
+        os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
+        self._csv_fh = open(
+            self.partial_csv_path, mode="w", newline="", encoding="utf-8"
+        )
+        self._writer = csv.DictWriter(
+            self._csv_fh,
+            fieldnames=self._build_headers(self.max_attorney_columns),
+            restval="",
+        )
+        self._writer.writeheader()
+        self._rows_since_flush = 0
+        self._max_attorneys_seen = 0
+        self.records_saved = 0
+
+    def save_row(self, item):
         """
-        Saves the collected, non-uniform scraped data to a flat CSV file.
-        It first determines the **maximum number of attorneys** found in any single record
-        across the entire dataset. County which will have max attorney's count is used to **dynamically generate
-        the necessary number of attorney headers** (e.g., 'Attorney Name 1', 'Attorney Name 2', etc.),
-        ensuring every record aligns correctly.
+        Flattens one scraped record into a dict keyed by CSV column and writes it
+        immediately; columns the record does not fill are left empty. A record with
+        more attorneys than the writer's columns widens the writer's field names,
+        and the header itself is widened by `close_csv`. The buffer is flushed to
+        disk every `csv_flush_rows` rows.
         """
+        row = {
+            "Case Number": item.get("Case Number", ""),
+            "Case Type": item.get("Case Type", ""),
+            "PDF File": item.get("PDF File", ""),
+        }
+        attorney_info: List[Dict[str, str]] = item.get("Attorney Info", [])
+        for i, attorney_dict in enumerate(attorney_info, 1):
+            row[f"Attorney Name {i}"] = attorney_dict.get("AttorneyName", "")
+            row[f"Attorney Address {i}"] = attorney_dict.get("AttorneyAddress", "")
+
+        if len(attorney_info) > max(
+            self._max_attorneys_seen, self.max_attorney_columns
+        ):
+            self._writer.fieldnames = self._build_headers(len(attorney_info))
+        self._max_attorneys_seen = max(self._max_attorneys_seen, len(attorney_info))
 
-        folder_name = "Scraped Data"
-        os.makedirs(folder_name, exist_ok=True)
-        file_name = "scraped_data.csv"
-        file_path = os.path.join(folder_name, file_name)
-        max_attorneys = self._get_max_attorneys_in_batch(scraped_data)
-
-        base_headers = ["Case Number", "Case Type", "PDF File"]
-        attorney_headers = []
-        for i in range(1, max_attorneys + 1):
-            attorney_headers.extend([f"Attorney Name {i}", f"Attorney Address {i}"])
-
-        final_headers = base_headers + attorney_headers
-
-        data_rows = []
-        required_attorney_cols = len(attorney_headers)
-
-        for item in scraped_data:
-            row = [
-                item.get("Case Number", ""),
-                item.get("Case Type", ""),
-                item.get("PDF File", ""),
-            ]
-            attorney_info: List[Dict[str, str]] = item.get("Attorney Info", [])
-            flattened_attorneys = []
+        try:
+            self._writer.writerow(row)
+            self.records_saved += 1
+            self._rows_since_flush += 1
+            if self._rows_since_flush >= self.csv_flush_rows:
+                self._csv_fh.flush()
+                self._rows_since_flush = 0
+        except Exception as e:
+            self.logger.error(f"Error saving to CSV: {e}")
 
-            for attorney_dict in attorney_info:
-                name = attorney_dict.get("AttorneyName", "")
-                address = attorney_dict.get("AttorneyAddress", "")
-                flattened_attorneys.extend([name, address])
+    def close_csv(self, completed=True):
+        """
+        Closes the CSV. If any case had more attorneys than the reserved columns,
+        the header is widened in a final pass so every record aligns correctly.
+        When the run completed, the streamed file replaces `csv_path`; otherwise it
+        is kept at `partial_csv_path` and the previous CSV is left untouched.
+        """
+        if self._csv_fh is None:
+            return
+        self._csv_fh.close()
+        self._csv_fh = None
+        self._writer = None
 
-            padding_needed = required_attorney_cols - len(flattened_attorneys)
+        if self._max_attorneys_seen > self.max_attorney_columns:
+            self._widen_header(self._max_attorneys_seen)
 
-            row.extend(flattened_attorneys)
-            row.extend([""] * padding_needed)
+        if not completed:
+            self.logger.error(
+                f"Run did not complete. {self.records_saved} records were kept in {self.partial_csv_path}; {self.csv_path} was not replaced."
+            )
+            return
 
-            data_rows.append(row)
+        os.replace(self.partial_csv_path, self.csv_path)
+        self.logger.info(f"Data successfully saved to {self.csv_path}")
+        self.logger.info(f"Total records saved: {self.records_saved}")
 
+    def _widen_header(self, attorney_columns):
+        """Rewrites the streamed CSV with a header for `attorney_columns` attorney pairs."""
+        headers = self._build_headers(attorney_columns)
         try:
-            with open(file_path, mode="w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-
-                writer.writerow(final_headers)
-                writer.writerows(data_rows)
-
-            self.logger.info(f"Data successfully saved to {file_path}")
-            self.logger.info(f"Total records saved: {len(data_rows)}")
+            with open(self.partial_csv_path, newline="", encoding="utf-8") as csvfile:
+                data_rows = list(csv.reader(csvfile))[1:]
 
+            with open(
+                self.partial_csv_path, mode="w", newline="", encoding="utf-8"
+            ) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(headers)
+                writer.writerows(
+                    row + [""] * (len(headers) - len(row)) for row in data_rows
+                )
         except Exception as e:
-            print(f"Error saving to CSV: {e}")
+            self.logger.error(f"Error widening CSV header: {e}")
 
 
 if __name__ == "__main__":